@@ -0,0 +1,88 @@
+import base64
+
+import numpy as np
+
+ENCODINGS = ("list", "base64")
+
+
+def gather(collection, attribute, width, dtype=np.float32):
+    """Read one property of every item in a bpy collection into a flat array"""
+    buffer = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, buffer)
+    return buffer
+
+
+def positions(collection, names):
+    """Indices of the named items in a bpy collection, for selecting rows"""
+    index = {name: i for i, name in enumerate(collection.keys())}
+    return np.fromiter((index[name] for name in names), np.int64, len(names))
+
+
+def gather_matrices(collection, attribute="matrix_world"):
+    """4x4 matrices of every item, row-major (Blender stores them by column)"""
+    return gather(collection, attribute, 16).reshape(-1, 4, 4).transpose(0, 2, 1)
+
+
+def world_aabbs(matrices, corners):
+    """World-space (min, max) of each item's local bounding box corners.
+
+    matrices is (n, 4, 4) row-major, corners is (n, 8, 3).
+    """
+    world = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners)
+    world += matrices[:, None, :3, 3]
+    return world.min(axis=1), world.max(axis=1)
+
+
+def encode(array, encoding="list"):
+    """An array as nested JSON lists, or as little-endian base64 with its shape"""
+    if encoding == "base64":
+        if array.dtype.kind == "f":
+            array = array.astype("<f4")
+        else:
+            array = array.astype(array.dtype.newbyteorder("<"))
+        array = np.ascontiguousarray(array)
+        return {
+            "dtype": array.dtype.name,
+            "shape": list(array.shape),
+            "base64": base64.b64encode(array.tobytes()).decode("ascii"),
+        }
+    if array.dtype.kind == "f":
+        return np.round(array.astype(np.float64), 6).tolist()
+    return array.tolist()
+
+
+def mesh_arrays(mesh, normals=True):
+    """Vertex, polygon and normal buffers of a mesh, one foreach_get each.
+
+    Polygons are given as their sizes plus the flat list of their vertex
+    indices, so chunks can be concatenated without rebasing offsets.
+    """
+    data = {
+        "vertices": gather(mesh.vertices, "co", 3).reshape(-1, 3),
+        "polygon_sizes": gather(mesh.polygons, "loop_total", 1, np.int32),
+        "polygon_vertices": gather(mesh.loops, "vertex_index", 1, np.int32),
+    }
+    if normals:
+        vertex_normals = gather(mesh.vertex_normals, "vector", 3)
+        polygon_normals = gather(mesh.polygon_normals, "vector", 3)
+        data["vertex_normals"] = vertex_normals.reshape(-1, 3)
+        data["polygon_normals"] = polygon_normals.reshape(-1, 3)
+    return data
+
+
+def mesh_chunk(data, index, size):
+    """Vertices and polygons [index * size, (index + 1) * size) of mesh_arrays"""
+    start, end = index * size, (index + 1) * size
+    sizes = data["polygon_sizes"]
+    # Loops of the earlier polygons come first in polygon_vertices
+    first_loop = int(sizes[:start].sum())
+    last_loop = first_loop + int(sizes[start:end].sum())
+    chunk = {
+        "vertices": data["vertices"][start:end],
+        "polygon_sizes": sizes[start:end],
+        "polygon_vertices": data["polygon_vertices"][first_loop:last_loop],
+    }
+    if "vertex_normals" in data:
+        chunk["vertex_normals"] = data["vertex_normals"][start:end]
+        chunk["polygon_normals"] = data["polygon_normals"][start:end]
+    return chunk
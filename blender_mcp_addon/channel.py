@@ -0,0 +1,158 @@
+import queue
+import socket
+import threading
+import time
+
+from .protocol import ProtocolError, send_frame, recv_frame
+
+
+class ClientChannel:
+    """One persistent bridge connection carrying many pipelined commands.
+
+    The reader loop queues every incoming frame without waiting for its result.
+    Completed commands are handed to a writer thread, so responses go out in
+    completion order and are matched by the client through `request_id`.
+    """
+
+    # Control frame a client sends to abandon one of its in-flight commands
+    CANCEL = "__cancel__"
+    # Seconds between sweeps for commands past their deadline
+    EXPIRE_INTERVAL = 0.5
+
+    def __init__(self, server, client, command_timeout=60.0):
+        self.server = server
+        self.client = client
+        # Fallback for frames that don't carry the caller's own `timeout`
+        self.command_timeout = command_timeout
+        self.outbox = queue.Queue()
+        self.pending = {}  # request_id -> [deadline, ticket]
+        self.lock = threading.Lock()
+        self.open = True
+
+    def serve(self):
+        writer = threading.Thread(target=self._writer_loop, daemon=True)
+        writer.start()
+        try:
+            while self.open and self.server.running:
+                try:
+                    command = recv_frame(self.client)
+                except socket.timeout:
+                    with self.lock:
+                        if self.pending:
+                            continue  # Still waiting on our own work
+                    break  # Idle eviction
+                if command is None:
+                    break
+                self._submit(command)
+        except ProtocolError as e:
+            print(f"[MCP] Protocol error: {e}")
+            self.outbox.put({"status": "error", "message": str(e)})
+        finally:
+            self.open = False
+            # Nobody is left to read these results, so don't run them
+            with self.lock:
+                abandoned = [entry[1] for entry in self.pending.values()]
+                self.pending.clear()
+            for ticket in abandoned:
+                if ticket is not None:
+                    ticket.cancel("client disconnected")
+            writer.join(timeout=5.0)
+
+    def _submit(self, command):
+        rid = command.get("request_id")
+        if rid is None:
+            self.outbox.put(
+                {"status": "error", "message": "Pipelined commands need a request_id"}
+            )
+            return
+        if command.get("type") == self.CANCEL:
+            self._cancel(rid, (command.get("params") or {}).get("request_id"))
+            return
+        with self.lock:
+            if rid in self.pending:
+                self.outbox.put(
+                    {
+                        "status": "error",
+                        "message": f"Duplicate request_id '{rid}' already in flight",
+                        "request_id": rid,
+                    }
+                )
+                return
+            self.pending[rid] = [time.monotonic() + self._timeout(command), None]
+        ticket = self.server.submit_command(
+            command, lambda response: self._complete(rid, response)
+        )
+        with self.lock:
+            if rid in self.pending:
+                self.pending[rid][1] = ticket
+
+    def _timeout(self, command):
+        """Seconds the caller will wait for this command"""
+        try:
+            timeout = float(command.get("timeout"))
+        except (TypeError, ValueError):
+            return self.command_timeout
+        return timeout if timeout > 0 else self.command_timeout
+
+    def _cancel(self, rid, target):
+        """Abandon an in-flight command and tell the client what became of it"""
+        with self.lock:
+            entry = self.pending.pop(target, None)
+        response = {"status": "success", "request_id": rid, "target": target}
+        if entry is None or entry[1] is None:
+            response.update({"cancelled": False, "finished": True})
+        else:
+            ticket = entry[1]
+            response.update(
+                ticket.describe_cancel(ticket.cancel("cancelled by client"))
+            )
+        self.outbox.put(response)
+
+    def _complete(self, rid, response):
+        """Called from the main thread when a command finishes"""
+        with self.lock:
+            if self.pending.pop(rid, None) is None:
+                return  # Already answered with a timeout
+        if isinstance(response, dict):
+            response.setdefault("request_id", rid)
+        self.outbox.put(response)
+
+    def _expire(self):
+        now = time.monotonic()
+        with self.lock:
+            expired = [
+                (rid, entry[1]) for rid, entry in self.pending.items() if entry[0] < now
+            ]
+            for rid, _ in expired:
+                del self.pending[rid]
+        for rid, ticket in expired:
+            response = {
+                "status": "error",
+                "code": "TIMEOUT",
+                "message": "Command timed out",
+                "request_id": rid,
+            }
+            if ticket is not None:
+                response.update(ticket.describe_cancel(ticket.cancel("timeout")))
+            self.outbox.put(response)
+
+    def _writer_loop(self):
+        next_expiry = time.monotonic() + self.EXPIRE_INTERVAL
+        while True:
+            try:
+                response = self.outbox.get(timeout=self.EXPIRE_INTERVAL)
+            except queue.Empty:
+                if not self.open and self.outbox.empty():
+                    return
+            else:
+                try:
+                    send_frame(self.client, response)
+                except Exception as e:
+                    print(f"[MCP] Client write error: {e}")
+                    self.open = False
+                    return
+            # On a schedule, so steady traffic can't hold off the sweep
+            now = time.monotonic()
+            if now >= next_expiry:
+                self._expire()
+                next_expiry = now + self.EXPIRE_INTERVAL
@@ -0,0 +1,162 @@
+import itertools
+import time
+import traceback
+from collections import OrderedDict
+
+
+class Job:
+    """A long-running operation advanced one step at a time on the main thread"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+    def __init__(
+        self, job_id, kind, steps, total, params=None, describe=None, cleanup=None
+    ):
+        self.id = job_id
+        self.kind = kind
+        self.params = params or {}
+        self.state = self.QUEUED
+        self.total = total
+        self.done = 0
+        self.outputs = []  # One entry per completed step, e.g. a rendered frame
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_requested = False
+        self._steps = steps
+        self._describe = describe  # Optional callable adding live detail
+        self._cleanup = cleanup  # Optional callable run once the job finishes
+
+    @property
+    def finished(self):
+        return self.state in self.FINISHED
+
+    def step(self):
+        """Advance by one step. Returns False once the job has finished.
+
+        Each step yields one output, a list of outputs, or None while it is
+        still waiting on work happening elsewhere.
+        """
+        if self.finished:
+            return False
+        if self.cancel_requested:
+            self._finish(self.CANCELLED)
+            return False
+        if self.state == self.QUEUED:
+            self.state = self.RUNNING
+            self.started_at = time.time()
+        try:
+            output = next(self._steps)
+        except StopIteration:
+            self._finish(self.COMPLETED)
+            return False
+        except Exception as e:
+            traceback.print_exc()
+            self.error = str(e)
+            self._finish(self.FAILED)
+            return False
+        if isinstance(output, list):
+            self.outputs.extend(output)
+            self.done += len(output)
+        elif output is not None:
+            self.outputs.append(output)
+            self.done += 1
+        return True
+
+    def _finish(self, state):
+        self.state = state
+        self.finished_at = time.time()
+        self._steps.close()
+        if self._cleanup:
+            self._cleanup()
+
+    def to_dict(self, include_outputs=False):
+        end = self.finished_at or time.time()
+        info = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "state": self.state,
+            "progress": {
+                "done": self.done,
+                "total": self.total,
+                "percent": (
+                    round(100.0 * self.done / self.total, 1) if self.total else 0.0
+                ),
+            },
+            "elapsed": round(end - self.started_at, 3) if self.started_at else 0.0,
+            "params": self.params,
+        }
+        if self.error:
+            info["error"] = self.error
+        if self._describe:
+            info["workers"] = self._describe()
+        if include_outputs:
+            info["outputs"] = list(self.outputs)
+        elif self.outputs:
+            info["last_output"] = self.outputs[-1]
+        return info
+
+
+class JobManager:
+    """Registry of jobs, stepped round-robin, one job step per timer tick"""
+
+    def __init__(self, keep=50):
+        self.keep = keep
+        self._jobs = OrderedDict()
+        self._ids = itertools.count(1)
+        self._last = None  # Id of the job stepped most recently
+
+    def submit(self, kind, steps, total, params=None, describe=None, cleanup=None):
+        job = Job(
+            f"job-{next(self._ids)}", kind, steps, total, params, describe, cleanup
+        )
+        self._jobs[job.id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id):
+        job = self._jobs.get(job_id)
+        if not job:
+            raise ValueError(f"Job '{job_id}' not found")
+        return job
+
+    def all(self):
+        return list(self._jobs.values())
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if not job.finished:
+            job.cancel_requested = True
+            if job.state == Job.QUEUED:
+                job.step()  # Finishes immediately as cancelled
+        return job
+
+    def active(self):
+        return any(not job.finished for job in self._jobs.values())
+
+    def step(self):
+        """Advance the next unfinished job after the last one stepped.
+
+        Rotating keeps a job that only waits on other processes, such as a
+        render worker pool, from starving the jobs submitted after it.
+        """
+        jobs = list(self._jobs.values())
+        ids = list(self._jobs)
+        start = ids.index(self._last) + 1 if self._last in self._jobs else 0
+        for job in jobs[start:] + jobs[:start]:
+            if not job.finished:
+                self._last = job.id
+                job.step()
+                return job
+        return None
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(self._jobs) - self.keep)]:
+            del self._jobs[job_id]
@@ -0,0 +1,66 @@
+import bisect
+
+# Revisions kept; a client further behind than this is told to re-fetch
+JOURNAL_SIZE = 1000
+
+
+class SceneJournal:
+    """Numbered record of which objects were added, removed or modified.
+
+    Each record() call that changes anything bumps the revision by one.
+    changes_since() merges the records after a revision, so its cost
+    depends on how much changed, not on how many objects the scene has.
+    """
+
+    def __init__(self, size=JOURNAL_SIZE):
+        self.size = size
+        self.revision = 0
+        self._revisions = []  # Ascending, parallel to _records
+        self._records = []  # (added, removed, modified) frozensets
+        self._floor = 0  # Changes after this revision are all retained
+
+    def record(self, added=(), removed=(), modified=()):
+        added, removed = frozenset(added), frozenset(removed)
+        modified = frozenset(modified) - added - removed
+        if not (added or removed or modified):
+            return self.revision
+        self.revision += 1
+        self._revisions.append(self.revision)
+        self._records.append((added, removed, modified))
+        if len(self._records) > self.size:
+            # Trim in halves so appends stay cheap once the journal is full
+            drop = len(self._records) - self.size // 2
+            self._floor = self._revisions[drop - 1]
+            del self._revisions[:drop]
+            del self._records[:drop]
+        return self.revision
+
+    def changes_since(self, since):
+        """Net changes after revision `since`, or None if they were trimmed"""
+        if since < self._floor or since > self.revision:
+            return None
+        # name -> "added" / "removed" / "modified", relative to `since`
+        net = {}
+        start = bisect.bisect_right(self._revisions, since)
+        for added, removed, modified in self._records[start:]:
+            for name in added:
+                # Removed then re-created: it existed at `since`, so it changed
+                net[name] = "modified" if net.get(name) == "removed" else "added"
+            for name in removed:
+                if net.get(name) == "added":
+                    del net[name]  # Created and deleted in between
+                else:
+                    net[name] = "removed"
+            for name in modified:
+                net.setdefault(name, "modified")
+        changes = {"added": [], "removed": [], "modified": []}
+        for name in sorted(net):
+            changes[net[name]].append(name)
+        return changes
+
+    def stats(self):
+        return {
+            "revision": self.revision,
+            "retained": len(self._records),
+            "oldest": self._floor,
+        }
@@ -0,0 +1,90 @@
+"""
+Wire protocol between the Blender addon and the MCP Bridge.
+
+Every message is a 4-byte big-endian length header followed by a UTF-8 JSON
+payload. Legacy clients that send raw JSON (first byte '{') and wait for the
+socket to close are still accepted by the server.
+Keep in sync with src/protocol.py.
+"""
+
+import json
+import struct
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+SMALL_FRAME_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Raised when the peer sends a malformed or oversized frame"""
+
+
+def is_legacy_prefix(data):
+    """Legacy clients start with a raw JSON object instead of a length header"""
+    return data[:1] == b"{"
+
+
+def send_frame(sock, message):
+    """Send one message as a framed payload"""
+    payload = json.dumps(message).encode("utf-8")
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+    header = HEADER.pack(len(payload))
+    if len(payload) <= SMALL_FRAME_SIZE:
+        # Keep small frames in one segment
+        sock.sendall(header + payload)
+    else:
+        # Avoid copying large payloads just to prepend the header
+        sock.sendall(header)
+        sock.sendall(memoryview(payload))
+
+
+def _recv_into(sock, buf):
+    """Fill `buf` completely. Returns False if the peer closed before any byte."""
+    view = memoryview(buf)
+    received = 0
+    while received < len(buf):
+        count = sock.recv_into(view[received:], min(len(buf) - received, CHUNK_SIZE))
+        if not count:
+            if received == 0:
+                return False
+            raise ProtocolError("Connection closed mid-frame")
+        received += count
+    return True
+
+
+def recv_frame(sock):
+    """Receive one framed message. Returns None on a clean end of stream."""
+    header = bytearray(HEADER.size)
+    if not _recv_into(sock, header):
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+    # Preallocate the payload and read straight into it
+    payload = bytearray(length)
+    if length and not _recv_into(sock, payload):
+        raise ProtocolError("Connection closed mid-frame")
+    return json.loads(payload)
+
+
+def recv_legacy(sock):
+    """Read an unframed JSON object from a legacy client that never half-closes"""
+    data = bytearray()
+    decoder = json.JSONDecoder()
+    while True:
+        if data.rstrip().endswith(b"}"):
+            try:
+                message, _ = decoder.raw_decode(data.decode("utf-8"))
+                return message
+            except ValueError:
+                pass  # Incomplete object, keep reading
+        if len(data) > MAX_FRAME_SIZE:
+            raise ProtocolError(f"Frame too large: {len(data)} bytes")
+        chunk = sock.recv(CHUNK_SIZE)
+        if not chunk:
+            if not data:
+                return None
+            return json.loads(data.decode("utf-8"))
+        data += chunk
@@ -0,0 +1,64 @@
+from .scheduler import INTERACTIVE, LANES, NORMAL
+
+
+class ToolSpec:
+    """What the dispatcher needs to know about one tool handler"""
+
+    def __init__(self, name, attr, lane, read_only, undo, internal):
+        self.name = name
+        self.attr = attr  # Method name on the server
+        self.lane = lane
+        self.read_only = read_only
+        self.undo = undo
+        self.internal = internal
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "lane": self.lane,
+            "read_only": self.read_only,
+            "undo": self.undo,
+            "internal": self.internal,
+        }
+
+
+def tool(name=None, lane=None, read_only=False, undo=None, internal=False):
+    """Register a tool-mixin method as an MCP command handler.
+
+    name: command type, defaults to the method name
+    lane: scheduler lane, defaults to interactive for read-only tools
+    read_only: the tool does not change the scene
+    undo: push an undo step after the tool runs, defaults to not read_only
+    internal: handled by the addon but not advertised by the bridge
+    """
+
+    def decorate(func):
+        spec_lane = lane or (INTERACTIVE if read_only else NORMAL)
+        if spec_lane not in LANES:
+            raise ValueError(f"Unknown lane '{spec_lane}' for {func.__name__}")
+        func._mcp_tool = ToolSpec(
+            name or func.__name__,
+            func.__name__,
+            spec_lane,
+            read_only,
+            (not read_only) if undo is None else undo,
+            internal,
+        )
+        return func
+
+    return decorate
+
+
+def collect_tools(cls):
+    """Every registered handler on a server class, keyed by command type"""
+    specs = {}
+    for attr in dir(cls):
+        spec = getattr(getattr(cls, attr, None), "_mcp_tool", None)
+        if spec is None:
+            continue
+        if spec.name in specs:
+            raise ValueError(
+                f"Tool '{spec.name}' registered by both {specs[spec.name].attr} and {attr}"
+            )
+        specs[spec.name] = spec
+    return specs
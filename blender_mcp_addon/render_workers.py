@@ -0,0 +1,158 @@
+import os
+import re
+import shutil
+import subprocess
+import threading
+
+# Lines printed by `blender -b ... -a` while rendering
+FRAME_RE = re.compile(r"^Fra:(\d+)\b")
+SAVED_RE = re.compile(r"^Saved: '(.+)'")
+
+CPU_ENGINES = ("CYCLES", "BLENDER_WORKBENCH")
+
+
+def split_frames(start, end, step, workers):
+    """Split a frame range into up to `workers` contiguous chunks"""
+    frames = list(range(start, end + 1, step))
+    if not frames:
+        return []
+    workers = max(1, min(workers, len(frames)))
+    size, extra = divmod(len(frames), workers)
+    chunks, index = [], 0
+    for i in range(workers):
+        count = size + (1 if i < extra else 0)
+        chunks.append(frames[index : index + count])
+        index += count
+    return chunks
+
+
+class RenderWorker:
+    """One headless Blender process rendering a contiguous chunk of frames"""
+
+    def __init__(self, index, command, frames):
+        self.index = index
+        self.command = command
+        self.frames = frames
+        self.current_frame = None
+        self.outputs = []
+        self.log_tail = []
+        self.process = None
+        self._lock = threading.Lock()
+        self._reader = None
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+        )
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self):
+        for line in self.process.stdout:
+            line = line.strip()
+            with self._lock:
+                self.log_tail = (self.log_tail + [line])[-20:]
+                frame = FRAME_RE.match(line)
+                if frame:
+                    self.current_frame = int(frame.group(1))
+                saved = SAVED_RE.match(line)
+                if saved:
+                    self.outputs.append(
+                        {"frame": self.current_frame, "path": saved.group(1)}
+                    )
+
+    def take_outputs(self, seen):
+        """Outputs saved since the first `seen` were reported"""
+        with self._lock:
+            return self.outputs[seen:]
+
+    @property
+    def returncode(self):
+        return self.process.poll() if self.process else None
+
+    def finished(self):
+        return self.returncode is not None and not self._reader.is_alive()
+
+    def terminate(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "worker": self.index,
+                "frames": f"{self.frames[0]}-{self.frames[-1]}",
+                "current_frame": self.current_frame,
+                "done": len(self.outputs),
+                "total": len(self.frames),
+                "returncode": self.returncode,
+            }
+
+
+class RenderWorkerPool:
+    """Fans frame chunks of a saved scene snapshot out to `blender -b` workers"""
+
+    def __init__(
+        self, binary, snapshot, output, chunks, engine=None, threads=None, step=1
+    ):
+        self.snapshot = snapshot
+        self.workers = []
+        for index, frames in enumerate(chunks):
+            command = [binary, "-b", snapshot]
+            if engine:
+                command += ["-E", engine]
+            if output:
+                command += ["-o", output]
+            if threads:
+                command += ["-t", str(threads)]
+            command += ["-s", str(frames[0]), "-e", str(frames[-1])]
+            command += ["-j", str(step), "-a"]
+            if engine == "CYCLES":
+                command += ["--", "--cycles-device", "CPU"]
+            self.workers.append(RenderWorker(index, command, frames))
+
+    def describe(self):
+        return [worker.to_dict() for worker in self.workers]
+
+    def run(self):
+        """Job steps: yields newly saved frames (or None) until every worker exits"""
+        seen = [0] * len(self.workers)
+        try:
+            for worker in self.workers:
+                worker.start()
+            while True:
+                outputs = []
+                for i, worker in enumerate(self.workers):
+                    new = worker.take_outputs(seen[i])
+                    seen[i] += len(new)
+                    outputs.extend(new)
+                if outputs:
+                    yield outputs
+                elif all(worker.finished() for worker in self.workers):
+                    break
+                else:
+                    yield None
+            failed = [w for w in self.workers if w.returncode not in (0, None)]
+            if failed:
+                worker = failed[0]
+                detail = worker.log_tail[-1] if worker.log_tail else ""
+                raise RuntimeError(
+                    f"Render worker {worker.index} exited with code {worker.returncode}: {detail}"
+                )
+        finally:
+            self.cleanup()
+
+    def cleanup(self):
+        """Stop any running workers and delete the scene snapshot"""
+        for worker in self.workers:
+            worker.terminate()
+        shutil.rmtree(os.path.dirname(self.snapshot), ignore_errors=True)
@@ -0,0 +1,335 @@
+import bisect
+import fnmatch
+import os
+import re
+from collections import defaultdict
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .journal import SceneJournal
+from .spatial import SpatialGrid
+from .utils import world_bbox
+
+# First wildcard in a glob; everything before it is a literal prefix
+GLOB_CHARS = re.compile(r"[*?\[]")
+
+# Grid cell size bounds; the size itself follows the typical object extent
+MIN_CELL_SIZE = 0.5
+MAX_CELL_SIZE = 50.0
+
+
+class IndexEntry:
+    __slots__ = ("name", "pointer", "type", "collections", "scenes", "bbox")
+
+    def __init__(self, obj):
+        self.name = obj.name
+        self.pointer = obj.as_pointer()  # Survives renames, unlike the name
+        self.type = obj.type
+        self.collections = frozenset(c.name for c in obj.users_collection)
+        self.scenes = frozenset(s.name for s in obj.users_scene)
+        self.bbox = world_bbox(obj)
+
+    def same_as(self, other):
+        return (
+            self.type == other.type
+            and self.collections == other.collections
+            and self.scenes == other.scenes
+            and self.bbox == other.bbox
+        )
+
+
+class SceneIndex:
+    """Name, type, collection and world bounding box of every object.
+
+    Depsgraph updates and MCP commands only mark objects dirty; the next
+    query refreshes just those entries, adding and dropping them as objects
+    appear and disappear. A dirty object found under a new name replaces
+    its old entry. If the object count still disagrees afterwards, the
+    names are reconciled against bpy.data.objects, touching only the
+    differences. Renames that report no update at all leave a stale name
+    behind until it is next looked up. Undo, redo and file loads rebuild.
+
+    Every sync that finds changes records them in the journal under a new
+    revision: refreshed objects directly, rebuilds by comparing entries.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self._keys = []  # Sorted (normcase(name), name) pairs for prefix globs
+        self._by_type = defaultdict(set)
+        self._by_collection = defaultdict(set)
+        self._by_scene = defaultdict(set)
+        self._by_pointer = {}
+        self.grid = SpatialGrid()
+        self.journal = SceneJournal()
+        self._dirty = set()
+        self._stale = True
+        self._needs_eval = False
+        self._handlers = []
+        self.rebuilds = 0
+        self.refreshes = 0
+
+    def register(self):
+        @persistent
+        def on_depsgraph_update(scene, depsgraph):
+            self._on_depsgraph_update(depsgraph)
+
+        @persistent
+        def on_reload(*args):
+            self.invalidate()
+
+        self._handlers = [
+            (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+            (bpy.app.handlers.undo_post, on_reload),
+            (bpy.app.handlers.redo_post, on_reload),
+            (bpy.app.handlers.load_post, on_reload),
+        ]
+        for handlers, handler in self._handlers:
+            handlers.append(handler)
+        self.invalidate()
+
+    def unregister(self):
+        for handlers, handler in self._handlers:
+            if handler in handlers:
+                handlers.remove(handler)
+        self._handlers = []
+
+    def invalidate(self):
+        """Rebuild from scratch on the next query"""
+        self._stale = True
+
+    def touch(self):
+        """An MCP command changed the scene: evaluate it before the next query"""
+        self._needs_eval = True
+
+    def _on_depsgraph_update(self, depsgraph):
+        for update in depsgraph.updates:
+            data = update.id.original
+            if isinstance(data, bpy.types.Object):
+                self._dirty.add(data.name)
+            elif isinstance(data, bpy.types.Collection):
+                # Only members gained or lost; moved members report themselves
+                old = self._by_collection.get(data.name, set())
+                new = {obj.name for obj in data.objects}
+                self._dirty.update(old ^ new)
+
+    def sync(self):
+        if self._needs_eval:
+            self._needs_eval = False
+            # Fires depsgraph_update_post for whatever the command changed
+            bpy.context.view_layer.update()
+        if self._stale:
+            self._rebuild()
+            return
+        changes = {"added": [], "removed": [], "modified": []}
+        for name in self._dirty:
+            self._refresh(name, changes)
+        self._dirty.clear()
+        if len(bpy.data.objects) != len(self.entries):
+            # Something changed without an update: diff the names only
+            names = set(bpy.data.objects.keys())
+            for name in (self.entries.keys() - names) | (names - self.entries.keys()):
+                self._refresh(name, changes)
+        self.journal.record(**changes)
+
+    def _rebuild(self):
+        previous, dirty = dict(self.entries), set(self._dirty)
+        self.entries.clear()
+        self._by_type.clear()
+        self._by_collection.clear()
+        self._by_scene.clear()
+        self._by_pointer.clear()
+        entries = [IndexEntry(obj) for obj in bpy.data.objects]
+        self.grid.clear(cell_size_for(entry.bbox for entry in entries))
+        for entry in entries:
+            self._add(entry)
+        self._keys = sorted((os.path.normcase(name), name) for name in self.entries)
+        self._dirty.clear()
+        self._stale = False
+        if self.rebuilds:  # The first build is the baseline, not a change
+            self._record_rebuild(previous, dirty)
+        self.rebuilds += 1
+
+    def _record_rebuild(self, previous, dirty):
+        entries = self.entries
+        self.journal.record(
+            added=entries.keys() - previous.keys(),
+            removed=previous.keys() - entries.keys(),
+            modified=[
+                name
+                for name, entry in entries.items()
+                if name in previous
+                and (name in dirty or not entry.same_as(previous[name]))
+            ],
+        )
+
+    def _refresh(self, name, changes):
+        """Re-read one object, noting it in changes as added, removed or modified"""
+        obj = bpy.data.objects.get(name)
+        known = name in self.entries
+        if known:
+            self._remove(self.entries.pop(name))
+        if obj is not None:
+            entry = IndexEntry(obj)
+            renamed_from = self._by_pointer.get(entry.pointer)
+            if renamed_from is not None and renamed_from != name:
+                self._drop(renamed_from)
+                changes["removed"].append(renamed_from)
+            self._add(entry)
+            if not known:
+                bisect.insort(self._keys, (os.path.normcase(name), name))
+            changes["modified" if known else "added"].append(name)
+        elif known:
+            self._unkey(name)
+            changes["removed"].append(name)
+        self.refreshes += 1
+
+    def _drop(self, name):
+        """Forget an entry whose object is gone or now has another name"""
+        entry = self.entries.pop(name, None)
+        if entry is None:
+            return
+        self._remove(entry)
+        self._unkey(name)
+
+    def _unkey(self, name):
+        key = (os.path.normcase(name), name)
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def _add(self, entry):
+        self.entries[entry.name] = entry
+        self._by_pointer[entry.pointer] = entry.name
+        self._by_type[entry.type].add(entry.name)
+        for coll in entry.collections:
+            self._by_collection[coll].add(entry.name)
+        for scene in entry.scenes:
+            self._by_scene[scene].add(entry.name)
+        self.grid.insert(entry.name, *entry.bbox)
+
+    def _remove(self, entry):
+        if self._by_pointer.get(entry.pointer) == entry.name:
+            del self._by_pointer[entry.pointer]
+        self._by_type[entry.type].discard(entry.name)
+        for coll in entry.collections:
+            self._by_collection[coll].discard(entry.name)
+        for scene in entry.scenes:
+            self._by_scene[scene].discard(entry.name)
+        self.grid.remove(entry.name)
+
+    def get(self, name):
+        self.sync()
+        entry = self.entries.get(name)
+        if entry is not None and bpy.data.objects.get(name) is None:
+            self._forget([name])
+            return None
+        return entry
+
+    def _forget(self, names):
+        """Drop names left behind by renames that reported no update"""
+        changes = {"added": [], "removed": [], "modified": []}
+        for name in names:
+            self._refresh(name, changes)
+        self.journal.record(**changes)
+
+    def glob(self, pattern):
+        """Object names matching a glob, with fnmatch.filter semantics"""
+        self.sync()
+        wildcard = GLOB_CHARS.search(pattern)
+        literal = pattern[: wildcard.start()] if wildcard else pattern
+        prefix = os.path.normcase(literal)
+        start = bisect.bisect_left(self._keys, (prefix,))
+        names, stale = [], []
+        for key, name in self._keys[start:]:
+            if not key.startswith(prefix):
+                break
+            if fnmatch.fnmatch(name, pattern):
+                if bpy.data.objects.get(name) is None:
+                    stale.append(name)
+                else:
+                    names.append(name)
+        if stale:
+            self._forget(stale)
+        return names
+
+    def of_type(self, types):
+        self.sync()
+        return set().union(*(self._by_type.get(t, ()) for t in types))
+
+    def in_collection(self, coll):
+        """Objects in a collection or any of its child collections"""
+        self.sync()
+        names = set()
+        for child in [coll, *coll.children_recursive]:
+            names.update(self._by_collection.get(child.name, ()))
+        return names
+
+    def in_scene(self, scene_name):
+        self.sync()
+        return set(self._by_scene.get(scene_name, ()))
+
+    def member_test(self, scene_name, types=None):
+        """A name -> bool check for objects in a scene (and of given types).
+
+        Tests the live reverse maps, so filtering query results costs
+        nothing per object in the scene.
+        """
+        self.sync()
+        in_scene = self._by_scene.get(scene_name, set())
+        of_type = [self._by_type.get(t, set()) for t in types] if types else None
+
+        def accept(name):
+            if name not in in_scene:
+                return False
+            return of_type is None or any(name in names for names in of_type)
+
+        return accept
+
+    def in_box(self, low, high):
+        """Objects whose world bounding box overlaps the box [low, high]"""
+        self.sync()
+        return self.grid.in_box(low, high)
+
+    def in_radius(self, center, radius):
+        """(name, distance) of objects whose box comes within radius, nearest first"""
+        self.sync()
+        return self.grid.in_radius(center, radius)
+
+    def nearest(self, point, k, accept=None):
+        """The k (name, distance) pairs whose boxes are closest to a point"""
+        self.sync()
+        return self.grid.nearest(point, k, accept=accept)
+
+    def overlapping_pairs(self, names=None, tolerance=0.0):
+        """Sorted pairs of objects whose world bounding boxes interpenetrate"""
+        self.sync()
+        return self.grid.overlapping_pairs(names, tolerance)
+
+    def overlapping(self, low, high, names=None):
+        """Objects overlapping the box [low, high], optionally among names"""
+        hits = self.in_box(low, high)
+        if names is not None:
+            names = set(names)
+            hits = [name for name in hits if name in names]
+        return hits
+
+    def stats(self):
+        return {
+            "objects": len(self.entries),
+            "dirty": len(self._dirty),
+            "rebuilds": self.rebuilds,
+            "refreshes": self.refreshes,
+            "grid_cell_size": self.grid.cell_size,
+            "journal": self.journal.stats(),
+        }
+
+
+def cell_size_for(bboxes):
+    """Median largest box extent, so a typical object spans a few cells"""
+    extents = sorted(max(h - l for l, h in zip(low, high)) for low, high in bboxes)
+    if not extents:
+        return None
+    size = extents[len(extents) // 2] * 2
+    return min(max(size, MIN_CELL_SIZE), MAX_CELL_SIZE)
@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import deque
+
+# Priority classes for commands waiting on the main thread
+INTERACTIVE = "interactive"  # Cheap reads agents poll (get_*)
+NORMAL = "normal"  # Ordinary scene mutations
+LONG = "long"  # Renders and heavy geometry operations
+LANES = (INTERACTIVE, NORMAL, LONG)
+
+
+class CommandCancelled(Exception):
+    """Raised inside a handler when its caller has given up on the command"""
+
+
+class CommandTicket:
+    """Shared state between a queued command and whoever is waiting on it"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+
+    def __init__(self):
+        self.state = self.PENDING
+        self.abandoned = False  # Caller timed out or disconnected
+        self.reason = None
+        self._lock = threading.Lock()
+
+    def cancel(self, reason):
+        """Give up on the command. Returns the state it was found in."""
+        with self._lock:
+            self.abandoned = True
+            self.reason = reason
+            if self.state == self.PENDING:
+                self.state = self.CANCELLED
+                return self.PENDING
+            return self.state
+
+    def start(self):
+        """Claim the command for execution. False if it was cancelled first."""
+        with self._lock:
+            if self.state == self.CANCELLED:
+                return False
+            self.state = self.RUNNING
+            return True
+
+    def finish(self):
+        with self._lock:
+            self.state = self.DONE
+
+    def describe_cancel(self, found_state):
+        """Response fields telling the caller what happened to the command"""
+        if found_state == self.PENDING:
+            return {"cancelled": "before_start"}
+        if found_state == self.RUNNING:
+            return {"cancelled": "requested", "will_finish_late": True}
+        return {"cancelled": False, "finished": True}
+
+
+class CommandScheduler:
+    """Thread-safe priority lanes served by smooth weighted round-robin.
+
+    Each lane is FIFO. Every non-empty lane earns credit in proportion to its
+    weight, so interactive reads jump ahead of a backlog without starving
+    mutations or long-running jobs. Commands in different lanes may therefore
+    run out of submission order when they are in flight at the same time.
+    """
+
+    def __init__(self, weights=None, max_depth=256):
+        self.weights = weights or {INTERACTIVE: 8, NORMAL: 4, LONG: 1}
+        self.max_depth = max_depth
+        self.rejected = 0
+        self.cancelled_before_start = 0
+        self.cancelled_during_run = 0
+        self.finished_late = 0
+        self._lanes = {lane: deque() for lane in LANES}
+        self._credit = {lane: 0 for lane in LANES}
+        self._served = {lane: 0 for lane in LANES}
+        self._lock = threading.Lock()
+        # Set whenever work arrives; the main-thread timer checks it each tick
+        self.wake = threading.Event()
+
+    def put(self, item, lane=NORMAL):
+        """Queue an item. Returns False without queueing when the queue is full."""
+        if lane not in self._lanes:
+            lane = NORMAL
+        item["lane"] = lane
+        item["enqueued_at"] = time.perf_counter()
+        with self._lock:
+            if sum(len(q) for q in self._lanes.values()) >= self.max_depth:
+                self.rejected += 1
+                return False
+            self._lanes[lane].append(item)
+        self.wake.set()
+        return True
+
+    def get_nowait(self):
+        """Next item to run, or None when every lane is empty"""
+        with self._lock:
+            ready = [lane for lane in LANES if self._lanes[lane]]
+            if not ready:
+                return None
+            total = 0
+            for lane in ready:
+                self._credit[lane] += self.weights[lane]
+                total += self.weights[lane]
+            lane = max(ready, key=lambda name: self._credit[name])
+            self._credit[lane] -= total
+            # Idle lanes do not bank credit while empty
+            for name in LANES:
+                if name not in ready:
+                    self._credit[name] = 0
+            self._served[lane] += 1
+            return self._lanes[lane].popleft()
+
+    def empty(self):
+        with self._lock:
+            return not any(self._lanes.values())
+
+    def depth(self):
+        with self._lock:
+            return sum(len(q) for q in self._lanes.values())
+
+    def stats(self):
+        with self._lock:
+            return {
+                lane: {
+                    "depth": len(self._lanes[lane]),
+                    "served": self._served[lane],
+                    "weight": self.weights[lane],
+                }
+                for lane in LANES
+            }
+
+
+class TickStats:
+    """Per-tick stall metrics for the main-thread timer"""
+
+    def __init__(self, history=240):
+        self.ticks = 0
+        self.busy_ticks = 0
+        self.commands = 0
+        self.job_steps = 0
+        self.overruns = 0
+        self.max_tick_ms = 0.0
+        self.last_tick_ms = 0.0
+        self.command_seconds = 0.0
+        self._recent = deque(maxlen=history)
+        self._waits = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds):
+        """Time a command spent queued before the main thread picked it up"""
+        with self._lock:
+            self._waits.append(seconds * 1000.0)
+
+    def record(self, duration, commands, budget, job_steps=0, job_seconds=0.0):
+        """One timer tick; job steps count toward the tick, not the commands"""
+        ms = duration * 1000.0
+        with self._lock:
+            self.ticks += 1
+            if not commands and not job_steps:
+                return
+            self.busy_ticks += 1
+            self.commands += commands
+            self.job_steps += job_steps
+            if commands:
+                self.command_seconds += max(0.0, duration - job_seconds)
+            self.last_tick_ms = ms
+            self.max_tick_ms = max(self.max_tick_ms, ms)
+            if duration > budget:
+                self.overruns += 1
+            self._recent.append(ms)
+
+    def average_command_seconds(self):
+        with self._lock:
+            return self.command_seconds / self.commands if self.commands else 0.0
+
+    def snapshot(self):
+        with self._lock:
+            recent = sorted(self._recent)
+            waits = sorted(self._waits)
+            return {
+                "ticks": self.ticks,
+                "busy_ticks": self.busy_ticks,
+                "commands": self.commands,
+                "job_steps": self.job_steps,
+                "budget_overruns": self.overruns,
+                "last_tick_ms": round(self.last_tick_ms, 3),
+                "max_tick_ms": round(self.max_tick_ms, 3),
+                "p95_tick_ms": _percentile(recent, 0.95),
+                "queue_wait_ms": {
+                    "p50": _percentile(waits, 0.5),
+                    "p95": _percentile(waits, 0.95),
+                    "max": round(waits[-1], 3) if waits else 0.0,
+                },
+            }
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
@@ -1,10 +1,23 @@
 import socket
 import json
 import threading
+import time
 import traceback
-import queue
 import bpy
 
+from .protocol import is_legacy_prefix, recv_legacy, send_frame
+from .channel import ClientChannel
+from .jobs import JobManager
+from .scheduler import (
+    CommandCancelled,
+    CommandScheduler,
+    CommandTicket,
+    TickStats,
+    NORMAL,
+)
+from .registry import collect_tools
+from .scene_index import SceneIndex
+
 from .tools.scene import SceneTools
 from .tools.collections import CollectionTools
 from .tools.modeling import ModelingTools
@@ -14,10 +27,13 @@ from .tools.rendering import RenderingTools
 from .tools.camera import CameraTools
 from .tools.lighting import LightTools
 from .tools.history import HistoryTools
+from .tools.batch import BatchTools
+from .tools.spatial import SpatialTools
 
 
 class BlenderMCPServer(
     SceneTools,
+    SpatialTools,
     CollectionTools,
     ModelingTools,
     MaterialTools,
@@ -26,6 +42,7 @@ class BlenderMCPServer(
     CameraTools,
     LightTools,
     HistoryTools,
+    BatchTools,
 ):
     """Blender MCP Server for n8n with componentized tools"""
 
@@ -33,9 +50,42 @@ class BlenderMCPServer(
         self.server_socket = None
         self.running = False
         self.server_thread = None
-        self.command_queue = queue.Queue()
+        self.scheduler = CommandScheduler()
+        self.tick_stats = TickStats()
+        self.jobs = JobManager()
+        self.scene_index = SceneIndex()
+        self._mesh_export_cache = None
+        self._current_ticket = None
+        self._request_id = "unknown"
+        # Dispatcher built once from the @tool-registered handlers
+        self.tools = collect_tools(type(self))
+        self.handlers = {
+            name: getattr(self, spec.attr) for name, spec in self.tools.items()
+        }
+        # Main-thread time slice per timer tick before yielding back to the UI
+        self.tick_budget = 0.02
+        self.idle_interval = 0.005
+        self.busy_interval = 0.0
+        # Poll fast for a short while after activity, then back off while idle
+        self.hot_window = 2.0
+        self.max_idle_interval = 0.1
+        self.last_activity = 0.0
+        self._idle_backoff = self.idle_interval
         self.last_error = None
         self.timer_handle = None
+        # Undo granularity: "command", "batch", "every_n" or "off"
+        self.undo_policy = "command"
+        self.undo_every_n = 10
+        self.undo_pushes = 0
+        self.undo_push_seconds = 0.0
+        self._unpushed_commands = 0
+        # Persistent bridge connections are closed after this much idle time
+        self.client_idle_timeout = 300.0
+        # Admission control: connection threads beyond this are turned away
+        self.max_connections = 32
+        self.active_connections = 0
+        self.rejected_connections = 0
+        self._connections_lock = threading.Lock()
 
     def start_server(self, host="0.0.0.0", port=8888):
         if self.running:
@@ -49,6 +99,7 @@ class BlenderMCPServer(
             self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
             self.server_thread.start()
             self._register_timer()
+            self.scene_index.register()
             print(f"MCP Server started on {host}:{port}")
         except Exception as e:
             print(f"Failed to start server: {e}")
@@ -65,6 +116,7 @@ class BlenderMCPServer(
 
     def stop_server(self):
         self.running = False
+        self.scene_index.unregister()
         if self.server_socket:
             try:
                 self.server_socket.close()
@@ -84,6 +136,12 @@ class BlenderMCPServer(
                 self.server_socket.settimeout(1.0)
                 try:
                     client, _ = self.server_socket.accept()
+                    if not self._admit_connection():
+                        # Off the accept thread: the reply waits on the client
+                        threading.Thread(
+                            target=self._reject_connection, args=(client,), daemon=True
+                        ).start()
+                        continue
                     threading.Thread(
                         target=self._handle_client, args=(client,), daemon=True
                     ).start()
@@ -93,13 +151,78 @@ class BlenderMCPServer(
                 if self.running:
                     print(f"[MCP] Server loop error: {e}")
 
+    def _admit_connection(self):
+        with self._connections_lock:
+            if self.active_connections >= self.max_connections:
+                self.rejected_connections += 1
+                return False
+            self.active_connections += 1
+            return True
+
+    def _release_connection(self):
+        with self._connections_lock:
+            self.active_connections -= 1
+
+    def _reject_connection(self, client):
+        """Answer the first request with an overload error and hang up.
+
+        Peeks at the first byte (for up to 0.5 s) to answer legacy clients
+        in their own format, so it runs on its own short-lived thread.
+        """
+        try:
+            client.settimeout(0.5)
+            response = self._overload_response("too many connections")
+            prefix = client.recv(1, socket.MSG_PEEK)
+            if is_legacy_prefix(prefix):
+                client.sendall(json.dumps(response).encode("utf-8"))
+            elif prefix:
+                send_frame(client, response)
+        except Exception:
+            pass
+        finally:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _overload_response(self, reason):
+        """Fast rejection with a hint for when the queue should have drained"""
+        backlog = self.scheduler.depth() * self.tick_stats.average_command_seconds()
+        retry_after = round(min(30.0, max(0.1, backlog)), 2)
+        return {
+            "status": "error",
+            "code": "OVERLOADED",
+            "retry_after": retry_after,
+            "message": f"Blender is overloaded ({reason}). Retry after {retry_after}s.",
+        }
+
     def _handle_client(self, client):
         try:
-            client.settimeout(180.0)
-            data = client.recv(8192)
-            if not data:
+            client.settimeout(self.client_idle_timeout)
+            prefix = client.recv(1, socket.MSG_PEEK)
+            if not prefix:
+                return
+            if is_legacy_prefix(prefix):
+                self._handle_legacy_client(client)
+                return
+
+            # Framed clients keep the socket open and pipeline many commands
+            ClientChannel(self, client).serve()
+        except Exception as e:
+            print(f"[MCP] Client error: {e}")
+        finally:
+            self._release_connection()
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _handle_legacy_client(self, client):
+        """One unframed JSON command per connection, answered before close"""
+        try:
+            command = recv_legacy(client)
+            if command is None:
                 return
-            command = json.loads(data.decode("utf-8"))
             response = self.handle_command(command)
             client.sendall(json.dumps(response).encode("utf-8"))
         except Exception as e:
@@ -110,65 +233,165 @@ class BlenderMCPServer(
                 )
             except Exception:
                 pass
-        finally:
-            try:
-                client.close()
-            except Exception:
-                pass
 
-    def handle_command(self, command):
+    def submit_command(self, command, callback):
+        """Queue a command for the main thread; callback(response) runs when done.
+
+        Returns the command's ticket, or None if it was rejected outright.
+        """
         if not self.running:
-            return {"status": "error", "message": "Server not running"}
+            callback({"status": "error", "message": "Server not running"})
+            return None
+        ticket = CommandTicket()
+        item = {"command": command, "callback": callback, "ticket": ticket}
+        spec = self.tools.get(command.get("type", ""))
+        if not self.scheduler.put(item, spec.lane if spec else NORMAL):
+            callback(self._overload_response("command queue full"))
+            return None
+        return ticket
+
+    def handle_command(self, command):
         result_event, res_container = threading.Event(), {"result": None}
-        self.command_queue.put(
-            {"command": command, "event": result_event, "container": res_container}
-        )
+
+        def on_done(response):
+            res_container["result"] = response
+            result_event.set()
+
+        ticket = self.submit_command(command, on_done)
         if not result_event.wait(timeout=60.0):
-            return {"status": "error", "message": "Command timed out"}
+            found = ticket.cancel("timeout")
+            return {
+                "status": "error",
+                "code": "TIMEOUT",
+                "message": "Command timed out",
+                **ticket.describe_cancel(found),
+            }
         return res_container["result"]
 
+    def check_cancelled(self):
+        """Long-running handlers call this between steps to honour cancellation"""
+        ticket = self._current_ticket
+        if ticket is not None and ticket.abandoned:
+            raise CommandCancelled(f"Command cancelled ({ticket.reason})")
+
     def _process_queue(self):
         if not self.running:
             return None
+        started = time.perf_counter()
+        executed = job_steps = 0
+        job_seconds = 0.0
+        self.scheduler.wake.clear()
         try:
-            while not self.command_queue.empty():
-                try:
-                    item = self.command_queue.get_nowait()
-                    if not item:
-                        continue
-                    cmd, event, res = item["command"], item["event"], item["container"]
-                    try:
-                        res["result"] = self.execute_command(cmd)
-
-                        # Push to Undo Stack if it's a state-changing command
-                        cmd_type = cmd.get("type", "")
-                        if (
-                            cmd_type
-                            and not cmd_type.startswith("get_")
-                            and cmd_type
-                            not in ["undo", "redo", "render_frame", "render_animation"]
-                        ):
-                            try:
-                                bpy.ops.ed.undo_push(message=f"MCP: {cmd_type}")
-                            except Exception as e:
-                                print(f"[MCP] Warning: Failed to push undo step: {e}")
-
-                    except Exception as e:
-                        traceback.print_exc()
-                        res["result"] = {
+            # Run commands until the tick budget is spent, always at least one
+            while executed == 0 or time.perf_counter() - started < self.tick_budget:
+                item = self.scheduler.get_nowait()
+                if item is None:
+                    break
+                if not item["ticket"].start():
+                    # Caller already gave up: drop it without touching the scene
+                    self.scheduler.cancelled_before_start += 1
+                    item["callback"](
+                        {
                             "status": "error",
-                            "message": f"Execution error: {e}",
+                            "code": "CANCELLED",
+                            "cancelled": "before_start",
+                            "message": f"Command cancelled before it started ({item['ticket'].reason})",
                         }
-                    finally:
-                        event.set()
+                    )
+                    continue
+                executed += 1
+                self.tick_stats.record_wait(time.perf_counter() - item["enqueued_at"])
+                try:
+                    self._run_item(item)
                 except Exception as e:
                     print(f"[MCP] Queue processing error: {e}")
                     traceback.print_exc()
+            # "batch" undo policy: one step once a burst of commands drains
+            if (
+                self.undo_policy == "batch"
+                and self._unpushed_commands
+                and self.scheduler.empty()
+            ):
+                self.flush_undo()
+            # Background jobs (e.g. renders) advance one step per tick
+            if self.jobs.active():
+                step_started = time.perf_counter()
+                self.jobs.step()
+                job_seconds = time.perf_counter() - step_started
+                job_steps = 1
         except Exception as e:
             print(f"[MCP] Critical Timer Error: {e}")
             traceback.print_exc()
 
-        return 0.005
+        self.tick_stats.record(
+            time.perf_counter() - started,
+            executed,
+            self.tick_budget,
+            job_steps,
+            job_seconds,
+        )
+        return self._next_interval(executed + job_steps)
+
+    def _next_interval(self, executed=0):
+        """Come back sooner the more work is pending, back off while idle.
+
+        bpy.app.timers cannot be re-armed from the socket threads, so arrivals
+        set `scheduler.wake` and the timer stays on a short interval for a hot
+        window after the last command before backing off geometrically.
+        """
+        now = time.perf_counter()
+        pending = self.scheduler.depth()
+        if pending or self.scheduler.wake.is_set() or self.jobs.active():
+            # More work arrived during this tick: come straight back
+            self.last_activity = now
+            self._idle_backoff = self.idle_interval
+            return max(self.busy_interval, self.idle_interval / (1 + pending))
+        if executed:
+            self.last_activity = now
+        if now - self.last_activity < self.hot_window:
+            self._idle_backoff = self.idle_interval
+            return self.idle_interval
+        self._idle_backoff = min(self.max_idle_interval, self._idle_backoff * 2)
+        return self._idle_backoff
+
+    def _run_item(self, item):
+        cmd, callback, ticket = item["command"], item["callback"], item["ticket"]
+        result = None
+        self._current_ticket = ticket
+        try:
+            result = self.execute_command(cmd)
+
+            # Push to Undo Stack if it's a state-changing command
+            spec = self.tools.get(cmd.get("type", ""))
+            if spec and spec.undo:
+                self.record_undo_step(spec.name)
+
+        except CommandCancelled as e:
+            self.scheduler.cancelled_during_run += 1
+            result = {
+                "status": "error",
+                "code": "CANCELLED",
+                "cancelled": "during_execution",
+                "message": str(e),
+            }
+        except Exception as e:
+            traceback.print_exc()
+            result = {
+                "status": "error",
+                "message": f"Execution error: {e}",
+            }
+        finally:
+            self._current_ticket = None
+            ticket.finish()
+            if (
+                ticket.abandoned
+                and isinstance(result, dict)
+                and "cancelled" not in result
+            ):
+                self.scheduler.finished_late += 1
+                result["finished_late"] = True
+                print(f"[MCP] {cmd.get('type')} finished after its caller gave up")
+            callback(result)
 
     def execute_command(self, command):
         cmd_type, params, rid = (
@@ -177,88 +400,9 @@ class BlenderMCPServer(
             command.get("request_id", "unknown"),
         )
         print(f"[MCP][{rid}] Executing: {cmd_type}")
+        self._request_id = rid
 
-        # Map types to methods (inherited from tool classes)
-        # This keeps the dispatcher dynamic and maintains compatibility with existing client
-        methods = {
-            # Scene
-            "get_scene_info": self.get_scene_info,
-            "get_object_info": self.get_object_info,
-            "get_viewport_screenshot": self.get_viewport_screenshot,
-            "get_distance": self.get_distance,
-            # Collections
-            "create_collection": self.create_collection,
-            "set_active_collection": self.set_active_collection,
-            "move_to_collection": self.move_to_collection,
-            "get_collections": self.get_collections,
-            "remove_collection": self.remove_collection,
-            # Modeling
-            "create_primitive": self.create_primitive,
-            "create_cube": self.create_cube,
-            "create_cylinder": self.create_cylinder,
-            "create_sphere": self.create_sphere,
-            "create_icosphere": self.create_icosphere,
-            "create_torus": self.create_torus,
-            "create_text": self.create_text,
-            "create_plane": self.create_plane,
-            "duplicate_object": self.duplicate_object,
-            "duplicate_selection": self.duplicate_selection,
-            "create_and_array": self.create_and_array,
-            "batch_transform": self.batch_transform,
-            "apply_modifier": self.apply_modifier,
-            "copy_modifier": self.copy_modifier,
-            "remove_modifier": self.remove_modifier,
-            "boolean_operation": self.boolean_operation,
-            "transform_object": self.transform_object,
-            "circular_array": self.circular_array,
-            "select_objects": self.select_objects,
-            "select_by_pattern": self.select_by_pattern,
-            "delete_object": self.delete_object,
-            "set_object_dimensions": self.set_object_dimensions,
-            "join_objects": self.join_objects,
-            "random_distribute": self.random_distribute,
-            "extrude_mesh": self.extrude_mesh,
-            "inset_faces": self.inset_faces,
-            "shear_mesh": self.shear_mesh,
-            "invert_mesh_selection": self.invert_mesh_selection,
-            # Architectural (ArchBuilder)
-            "build_room_shell": self.build_room_shell,
-            "build_wall_segment": self.build_wall_segment,
-            "build_wall_with_door": self.build_wall_with_door,
-            "build_column": self.build_column,
-            "toggle_ceiling": self.toggle_ceiling,
-            "set_view": self.set_view,
-            # Animation
-            "set_keyframe": self.set_keyframe,
-            "get_keyframes": self.get_keyframes,
-            "set_timeline_range": self.set_timeline_range,
-            "play_animation": self.play_animation,
-            # Rendering
-            "configure_render_settings": self.configure_render_settings,
-            "render_frame": self.render_frame,
-            "render_animation": self.render_animation,
-            # Material
-            "create_material": self.create_material,
-            "set_material_properties": self.set_material_properties,
-            "assign_material": self.assign_material,
-            "add_shader_node": self.add_shader_node,
-            "connect_shader_nodes": self.connect_shader_nodes,
-            "assign_builtin_texture": self.assign_builtin_texture,
-            "assign_texture_map": self.assign_texture_map,
-            # Camera
-            "create_camera": self.create_camera,
-            "set_active_camera": self.set_active_camera,
-            "camera_look_at": self.camera_look_at,
-            # Light
-            "create_light": self.create_light,
-            "configure_light": self.configure_light,
-            "set_world_background": self.set_world_background,
-            # History
-            "undo": self.undo_action,
-            "redo": self.redo_action,
-        }
-
-        handler = methods.get(cmd_type)
+        handler = self.handlers.get(cmd_type)
         if not handler:
             return {"status": "error", "message": f"Unknown command: {cmd_type}"}
 
@@ -273,7 +417,13 @@ class BlenderMCPServer(
                         else f"[{rid}] {msg}"
                     )
             return {"status": "success", "result": result}
+        except CommandCancelled:
+            raise
         except Exception as e:
             print(f"[MCP] Handler error: {e}")
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
+        finally:
+            # Even a failed command may have changed part of the scene
+            if not self.tools[cmd_type].read_only:
+                self.scene_index.touch()
@@ -0,0 +1,173 @@
+import math
+from collections import defaultdict
+from itertools import combinations
+
+# Objects spanning more cells than this (floors, terrain) are kept in a
+# separate list that every query checks, instead of filling the grid
+MAX_CELLS_PER_OBJECT = 512
+
+
+def box_distance(point, low, high):
+    """Distance from a point to an axis-aligned box (0 inside it)"""
+    return math.sqrt(
+        sum(max(low[i] - point[i], 0.0, point[i] - high[i]) ** 2 for i in range(3))
+    )
+
+
+def boxes_overlap(a_low, a_high, b_low, b_high, tolerance=0.0):
+    """Whether two boxes interpenetrate by more than `tolerance` on every axis"""
+    return all(
+        min(a_high[i], b_high[i]) - max(a_low[i], b_low[i]) > tolerance
+        for i in range(3)
+    )
+
+
+class SpatialGrid:
+    """Uniform grid over world-space bounding boxes, updated per object.
+
+    Each box is registered in every cell it touches, so box, radius and
+    nearest-neighbour queries only look at the cells around the query.
+    """
+
+    def __init__(self, cell_size=2.0):
+        self.cell_size = cell_size
+        self.boxes = {}  # name -> (low, high)
+        self._cells = defaultdict(set)
+        self._cells_of = {}
+        self._large = set()
+        # Grows to cover every box ever inserted; only reset by clear()
+        self._bounds = ([0.0] * 3, [0.0] * 3)
+
+    def clear(self, cell_size=None):
+        if cell_size:
+            self.cell_size = cell_size
+        self.boxes.clear()
+        self._cells.clear()
+        self._cells_of.clear()
+        self._large.clear()
+        self._bounds = ([0.0] * 3, [0.0] * 3)
+
+    def _cell_range(self, low, high):
+        size = self.cell_size
+        return [
+            range(math.floor(low[i] / size), math.floor(high[i] / size) + 1)
+            for i in range(3)
+        ]
+
+    def insert(self, name, low, high):
+        if name in self.boxes:
+            self.remove(name)
+        self.boxes[name] = (low, high)
+        bounds_low, bounds_high = self._bounds
+        for i in range(3):
+            bounds_low[i] = min(bounds_low[i], low[i])
+            bounds_high[i] = max(bounds_high[i], high[i])
+        xs, ys, zs = self._cell_range(low, high)
+        if len(xs) * len(ys) * len(zs) > MAX_CELLS_PER_OBJECT:
+            self._large.add(name)
+            return
+        keys = [(x, y, z) for x in xs for y in ys for z in zs]
+        for key in keys:
+            self._cells[key].add(name)
+        self._cells_of[name] = keys
+
+    def remove(self, name):
+        if self.boxes.pop(name, None) is None:
+            return
+        self._large.discard(name)
+        for key in self._cells_of.pop(name, ()):
+            cell = self._cells[key]
+            cell.discard(name)
+            if not cell:
+                del self._cells[key]
+
+    def _candidates(self, low, high):
+        xs, ys, zs = self._cell_range(low, high)
+        found = set(self._large)
+        if len(xs) * len(ys) * len(zs) > len(self._cells):
+            # Query larger than the occupied grid: walk the cells instead
+            for (x, y, z), names in self._cells.items():
+                if x in xs and y in ys and z in zs:
+                    found |= names
+            return found
+        for x in xs:
+            for y in ys:
+                for z in zs:
+                    names = self._cells.get((x, y, z))
+                    if names:
+                        found |= names
+        return found
+
+    def in_box(self, low, high):
+        """Names whose box overlaps [low, high]"""
+        hits = []
+        for name in self._candidates(low, high):
+            b_low, b_high = self.boxes[name]
+            if all(b_low[i] <= high[i] and b_high[i] >= low[i] for i in range(3)):
+                hits.append(name)
+        return hits
+
+    def in_radius(self, center, radius):
+        """(name, distance) pairs for boxes within `radius`, nearest first"""
+        low = [c - radius for c in center]
+        high = [c + radius for c in center]
+        hits = []
+        for name in self._candidates(low, high):
+            distance = box_distance(center, *self.boxes[name])
+            if distance <= radius:
+                hits.append((name, distance))
+        return sorted(hits, key=lambda hit: hit[1])
+
+    def nearest(self, point, k, accept=None):
+        """The k (name, distance) pairs closest to `point`, searching outwards"""
+        if not self.boxes or k < 1:
+            return []
+        radius = self.cell_size
+        # Past this radius the search box covers every registered box
+        low, high = self._bounds
+        limit = math.sqrt(
+            sum(
+                max(abs(point[i] - low[i]), abs(point[i] - high[i])) ** 2
+                for i in range(3)
+            )
+        )
+        limit += self.cell_size
+        while True:
+            hits = [
+                (name, distance)
+                for name, distance in self.in_radius(point, radius)
+                if accept is None or accept(name)
+            ]
+            if len(hits) >= k or radius >= limit:
+                return hits[:k]
+            radius *= 2
+
+    def overlapping_pairs(self, names=None, tolerance=0.0):
+        """Sorted pairs of names whose boxes interpenetrate"""
+        allowed = None if names is None else set(names)
+        checked, pairs = set(), []
+
+        def check(a, b):
+            pair = (a, b) if a < b else (b, a)
+            if a == b or pair in checked:
+                return
+            checked.add(pair)
+            if allowed is not None and (a not in allowed or b not in allowed):
+                return
+            if boxes_overlap(*self.boxes[a], *self.boxes[b], tolerance):
+                pairs.append(pair)
+
+        if allowed is not None and len(allowed) < len(self.boxes) // 4:
+            # Few objects of interest: look only around their own boxes
+            for name in allowed & self.boxes.keys():
+                for other in self._candidates(*self.boxes[name]):
+                    check(name, other)
+            return sorted(pairs)
+        for members in self._cells.values():
+            if len(members) > 1:
+                for a, b in combinations(members, 2):
+                    check(a, b)
+        for large in self._large:
+            for other in self._candidates(*self.boxes[large]):
+                check(large, other)
+        return sorted(pairs)
@@ -1,9 +1,11 @@
 import bpy
 import math
 from ..utils import get_object
+from ..registry import tool
 
 
 class AnimationTools:
+    @tool()
     def set_keyframe(self, object_name, property_path, frame, value):
         """Set keyframe for object property"""
         obj = get_object(object_name)
@@ -26,6 +28,7 @@ class AnimationTools:
             "message": f"Set keyframe for '{property_path}' at frame {frame}",
         }
 
+    @tool(read_only=True)
     def get_keyframes(self, object_name):
         """Get all keyframes for an object"""
         obj = get_object(object_name)
@@ -49,6 +52,7 @@ class AnimationTools:
             "message": f"Retrieved keyframes for '{object_name}'",
         }
 
+    @tool()
     def set_timeline_range(self, start_frame, end_frame, current_frame=None):
         """Set timeline range"""
         scene = bpy.context.scene
@@ -65,6 +69,7 @@ class AnimationTools:
             "message": f"Timeline range set to {start_frame}-{end_frame}",
         }
 
+    @tool()
     def play_animation(self, play=True):
         """Play or stop animation"""
         if play:
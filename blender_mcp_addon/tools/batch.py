@@ -0,0 +1,210 @@
+import bpy
+
+from ..scheduler import CommandCancelled
+from ..registry import tool
+
+# Commands that make no sense inside a batch
+NOT_BATCHABLE = {"execute_batch", "undo", "redo"}
+
+
+def _scene_state():
+    """What a batch can change, as plain values that outlive an undo"""
+    objects = {}
+    for obj in bpy.data.objects:
+        objects[obj.name] = (
+            obj.type,
+            obj.data.name if obj.data else None,
+            obj.parent.name if obj.parent else None,
+            tuple(obj.location),
+            tuple(obj.rotation_euler),
+            tuple(obj.scale),
+            tuple(
+                slot.material.name if slot.material else None
+                for slot in obj.material_slots
+            ),
+            tuple((mod.name, mod.type, mod.show_viewport) for mod in obj.modifiers),
+            tuple(sorted(coll.name for coll in obj.users_collection)),
+            obj.hide_viewport,
+            obj.hide_render,
+            len(obj.data.vertices) if obj.type == "MESH" else None,
+        )
+    materials = {}
+    for mat in bpy.data.materials:
+        nodes = mat.node_tree.nodes if mat.node_tree else ()
+        materials[mat.name] = (
+            tuple(mat.diffuse_color),
+            mat.metallic,
+            mat.roughness,
+            tuple(sorted((node.name, node.type) for node in nodes)),
+        )
+    return {
+        "objects": objects,
+        "collections": {
+            coll.name: tuple(sorted(child.name for child in coll.children))
+            for coll in bpy.data.collections
+        },
+        "materials": materials,
+    }
+
+
+def _state_diff(before, after):
+    """Names whose state differs between two _scene_state() snapshots"""
+    changed = []
+    for kind in ("objects", "collections", "materials"):
+        old, new = before[kind], after[kind]
+        for name in sorted(old.keys() | new.keys()):
+            if old.get(name) != new.get(name):
+                changed.append(f"{kind}:{name}")
+    return changed
+
+
+class BatchTools:
+    @tool()
+    def execute_batch(self, commands, stop_on_error=True, transactional=False):
+        """Run an ordered list of tool calls in one main-thread slot.
+
+        A transactional batch stops at the first failure and reverts every
+        change the batch made, so a retry starts from the original scene.
+        """
+        if not isinstance(commands, list):
+            raise ValueError("commands must be a list of {tool, arguments} entries")
+
+        checkpoint = self._begin_transaction() if transactional else None
+        base_rid = self._request_id
+        results = []
+        failed = 0
+        try:
+            for index, entry in enumerate(commands):
+                self.check_cancelled()
+                entry_result = self._run_batch_entry(base_rid, index, entry)
+                results.append(entry_result)
+                if entry_result["status"] != "success":
+                    failed += 1
+                    if stop_on_error or transactional:
+                        break
+        except CommandCancelled:
+            if checkpoint is not None:
+                self._rollback(checkpoint)
+            raise
+        finally:
+            self._request_id = base_rid
+
+        rollback, unrestored = (
+            self._rollback(checkpoint) if checkpoint and failed else (None, [])
+        )
+        skipped = len(commands) - len(results)
+        message = (
+            f"Batch ran {len(results) - failed}/{len(commands)} command(s) as one undo step"
+            + (f"; {failed} failed" if failed else "")
+            + (f", {skipped} skipped" if skipped else "")
+            + "."
+        )
+        if rollback == "partial":
+            message += (
+                f" Rollback was partial: {len(unrestored)} item(s) could not be"
+                f" restored ({', '.join(unrestored[:10])})."
+            )
+        elif rollback:
+            message += f" All changes were rolled back ({rollback})."
+        response = {
+            "success": failed == 0,
+            "completed": len(results) - failed,
+            "failed": failed,
+            "skipped": skipped,
+            "rolled_back": rollback in ("undo", "removed_new_data"),
+            "rollback": rollback,
+            "results": results,
+            "message": message,
+        }
+        if unrestored:
+            response["unrestored"] = unrestored
+        return response
+
+    def _run_batch_entry(self, base_rid, index, entry):
+        tool = entry.get("tool") if isinstance(entry, dict) else None
+        if not tool:
+            response = {"status": "error", "message": "Entry has no 'tool'"}
+        elif tool in NOT_BATCHABLE:
+            response = {
+                "status": "error",
+                "message": f"'{tool}' cannot run inside a batch",
+            }
+        else:
+            response = self.execute_command(
+                {
+                    "type": tool,
+                    "params": entry.get("arguments") or {},
+                    "request_id": f"{base_rid}.{index + 1}",
+                }
+            )
+
+        entry_result = {"index": index, "tool": tool, "status": response["status"]}
+        result = response.get("result")
+        # Some handlers report failure in their result instead of raising
+        if isinstance(result, dict) and (
+            result.get("success") is False or result.get("status") == "error"
+        ):
+            entry_result["status"] = "error"
+            entry_result["message"] = result.get("error") or result.get("message")
+        elif response["status"] == "success":
+            entry_result["result"] = result
+        else:
+            entry_result["message"] = response.get("message")
+        return entry_result
+
+    def _begin_transaction(self):
+        """Mark where a transactional batch started"""
+        return {
+            "undo": self._push_undo("MCP: batch checkpoint"),
+            "state": _scene_state(),
+            "objects": set(bpy.data.objects.keys()),
+            "collections": set(bpy.data.collections.keys()),
+            "materials": set(bpy.data.materials.keys()),
+        }
+
+    def _rollback(self, checkpoint):
+        """Revert to the checkpoint.
+
+        Returns how the scene was restored ("undo", "removed_new_data" or
+        "partial") and the names that still differ from the checkpoint.
+        """
+        if checkpoint["undo"] and self._undo_to(checkpoint["state"]):
+            return "undo", []
+
+        # No usable undo stack (e.g. background mode): remove what the batch added
+        for name in set(bpy.data.objects.keys()) - checkpoint["objects"]:
+            bpy.data.objects.remove(bpy.data.objects[name], do_unlink=True)
+        for name in set(bpy.data.collections.keys()) - checkpoint["collections"]:
+            bpy.data.collections.remove(bpy.data.collections[name])
+        for name in set(bpy.data.materials.keys()) - checkpoint["materials"]:
+            bpy.data.materials.remove(bpy.data.materials[name])
+        unrestored = _state_diff(checkpoint["state"], _scene_state())
+        return ("partial" if unrestored else "removed_new_data"), unrestored
+
+    def _undo_to(self, state):
+        """Step back until the scene matches the checkpoint snapshot.
+
+        Entries may push undo steps of their own, so one undo is not enough.
+        Blender doesn't expose the undo stack to Python, so each step is
+        checked against the snapshot; if none matches within the stack's
+        length, the steps are redone and False is returned.
+        """
+        steps = 0
+        try:
+            # Record the failed state as its own step, then step back over it
+            bpy.ops.ed.undo_push(message="MCP: batch failed")
+            for _ in range(max(1, bpy.context.preferences.edit.undo_steps)):
+                if bpy.ops.ed.undo() != {"FINISHED"}:
+                    break
+                steps += 1
+                if not _state_diff(state, _scene_state()):
+                    return True
+        except Exception as e:
+            print(f"[MCP] Warning: Undo rollback failed: {e}")
+        # Never leave the scene further back than the checkpoint
+        for _ in range(steps):
+            try:
+                bpy.ops.ed.redo()
+            except Exception:
+                break
+        return False
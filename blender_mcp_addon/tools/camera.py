@@ -2,9 +2,11 @@ import bpy
 import math
 from mathutils import Vector
 from ..utils import get_object
+from ..registry import tool
 
 
 class CameraTools:
+    @tool()
     def create_camera(self, name, location, rotation=None, lens=50.0, type="PERSP"):
         """Create camera"""
         cam = bpy.data.objects.get(name)
@@ -36,12 +38,14 @@ class CameraTools:
             "message": f"Camera '{name}' {status} at {location}",
         }
 
+    @tool()
     def set_active_camera(self, camera_name):
         """Set active camera"""
         cam = get_object(camera_name)
         bpy.context.scene.camera = cam
         return {"success": True, "message": f"✓ Camera '{camera_name}' set as active"}
 
+    @tool()
     def camera_look_at(self, camera_name, target_location):
         """Point camera at target"""
         cam = get_object(camera_name)
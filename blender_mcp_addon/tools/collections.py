@@ -1,8 +1,10 @@
 import bpy
 from ..utils import get_collection, get_object
+from ..registry import tool
 
 
 class CollectionTools:
+    @tool()
     def create_collection(self, name, parent_collection=None, **kwargs):
         """Create new collection"""
         new_collection = bpy.data.collections.new(name)
@@ -19,6 +21,7 @@ class CollectionTools:
             "message": f"Collection '{name}' created successfully.",
         }
 
+    @tool()
     def set_active_collection(self, collection_name):
         """Set active collection for new objects"""
         get_collection(collection_name)
@@ -41,6 +44,7 @@ class CollectionTools:
         for child in layer_collection.children:
             yield from self._find_layer_collection(child, name)
 
+    @tool()
     def move_to_collection(self, object_names, collection_name, **kwargs):
         """Move objects to collection"""
         collection = get_collection(collection_name)
@@ -59,6 +63,7 @@ class CollectionTools:
             "message": f"Successfully moved {len(object_names)} object(s) to collection '{collection_name}'",
         }
 
+    @tool(read_only=True)
     def get_collections(self):
         """List all collections"""
 
@@ -74,6 +79,7 @@ class CollectionTools:
 
         return build_hierarchy(bpy.context.scene.collection)
 
+    @tool()
     def remove_collection(self, name=None, pattern=None, delete_objects=True, **kwargs):
         """Remove collection(s) by name or pattern"""
         import fnmatch
@@ -101,15 +107,8 @@ class CollectionTools:
                 for obj in list(coll.objects):
                     bpy.data.objects.remove(obj, do_unlink=True)
 
-            # To remove a collection, we must unlink it from all its parents
-            for parent in bpy.data.collections:
-                if coll.name in parent.children:
-                    parent.children.unlink(coll)
-            if coll.name in bpy.context.scene.collection.children:
-                bpy.context.scene.collection.children.unlink(coll)
-
-            # Finally remove the collection from data
-            bpy.data.collections.remove(coll)
+            # do_unlink detaches it from every parent and scene in one pass
+            bpy.data.collections.remove(coll, do_unlink=True)
             count += 1
 
         return {
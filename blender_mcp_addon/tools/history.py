@@ -1,17 +1,118 @@
+import sys
+import time
+
 import bpy
+from ..registry import tool
+
+UNDO_POLICIES = ("command", "batch", "every_n", "off")
 
 
 class HistoryTools:
+    @tool("undo", undo=False)
     def undo_action(self):
         try:
+            # Changes not yet in an undo step would otherwise be lost
+            self.flush_undo()
             bpy.ops.ed.undo()
             return {"status": "success", "message": "Undo successful"}
         except Exception as e:
             return {"status": "error", "message": f"Undo failed: {str(e)}"}
 
+    @tool("redo", undo=False)
     def redo_action(self):
         try:
             bpy.ops.ed.redo()
             return {"status": "success", "message": "Redo successful"}
         except Exception as e:
             return {"status": "error", "message": f"Redo failed: {str(e)}"}
+
+    @tool(read_only=True)
+    def configure_undo(
+        self, policy=None, every_n=None, memory_limit_mb=None, max_steps=None
+    ):
+        """Choose how often MCP commands push undo steps and cap undo memory"""
+        if policy is not None:
+            if policy not in UNDO_POLICIES:
+                raise ValueError(f"policy must be one of {', '.join(UNDO_POLICIES)}")
+            # Close off changes made under the previous policy
+            if policy != self.undo_policy:
+                self.flush_undo()
+            self.undo_policy = policy
+        if every_n is not None:
+            if every_n < 1:
+                raise ValueError("every_n must be at least 1")
+            self.undo_every_n = int(every_n)
+        edit = bpy.context.preferences.edit
+        if memory_limit_mb is not None:
+            if memory_limit_mb < 0:
+                raise ValueError("memory_limit_mb must be 0 (unlimited) or more")
+            edit.undo_memory_limit = int(memory_limit_mb)
+        if max_steps is not None:
+            if max_steps < 0:
+                raise ValueError("max_steps must be 0 or more")
+            edit.undo_steps = int(max_steps)
+        info = self.undo_info()
+        info["success"] = True
+        info["message"] = f"Undo policy set to '{self.undo_policy}'."
+        return info
+
+    def undo_info(self):
+        edit = bpy.context.preferences.edit
+        return {
+            "policy": self.undo_policy,
+            "every_n": self.undo_every_n,
+            "unpushed_commands": self._unpushed_commands,
+            "pushes": self.undo_pushes,
+            "avg_push_ms": (
+                round(1000.0 * self.undo_push_seconds / self.undo_pushes, 3)
+                if self.undo_pushes
+                else 0.0
+            ),
+            "max_steps": edit.undo_steps,
+            "memory_limit_mb": edit.undo_memory_limit,
+            "process_peak_memory_mb": _peak_memory_mb(),
+        }
+
+    def record_undo_step(self, cmd_type):
+        """Called after each state-changing command, according to the undo policy"""
+        self._unpushed_commands += 1
+        if self.undo_policy == "command":
+            self._push_undo(f"MCP: {cmd_type}")
+        elif (
+            self.undo_policy == "every_n"
+            and self._unpushed_commands >= self.undo_every_n
+        ):
+            self.flush_undo()
+
+    def flush_undo(self):
+        """Push one step covering every command since the last push"""
+        if self._unpushed_commands and self.undo_policy != "off":
+            self._push_undo(f"MCP: {self._unpushed_commands} command(s)")
+        self._unpushed_commands = 0
+
+    def _push_undo(self, message):
+        self._unpushed_commands = 0
+        started = time.perf_counter()
+        try:
+            bpy.ops.ed.undo_push(message=message)
+        except Exception as e:
+            print(f"[MCP] Warning: Failed to push undo step: {e}")
+            return False
+        self.undo_pushes += 1
+        self.undo_push_seconds += time.perf_counter() - started
+        return True
+
+
+def _peak_memory_mb():
+    """Peak resident memory of Blender; undo steps are a large share of it.
+
+    Blender does not expose the undo stack size to Python, so this is the
+    closest figure available. None where the platform has no `resource`.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)
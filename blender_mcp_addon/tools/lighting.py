@@ -1,9 +1,11 @@
 import bpy
 import math
 from ..utils import hex_to_rgb, get_object
+from ..registry import tool
 
 
 class LightTools:
+    @tool()
     def create_light(
         self,
         name,
@@ -35,6 +37,7 @@ class LightTools:
             "message": f"Light '{name}' ({type}) created.",
         }
 
+    @tool()
     def configure_light(
         self, light_name, energy=None, color=None, rotation=None, angle=None, size=None
     ):
@@ -53,6 +56,7 @@ class LightTools:
 
         return {"success": True, "message": f"Light '{light_name}' updated."}
 
+    @tool()
     def set_world_background(
         self,
         mode="color",
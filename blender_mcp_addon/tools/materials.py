@@ -1,9 +1,10 @@
 import bpy
-import fnmatch
 from ..utils import hex_to_rgb, get_object
+from ..registry import tool
 
 
 class MaterialTools:
+    @tool()
     def create_material(
         self,
         name,
@@ -144,6 +145,7 @@ class MaterialTools:
             "message": msg,
         }
 
+    @tool()
     def set_material_properties(self, material_name, **kwargs):
         """Modify existing material properties"""
         mat = bpy.data.materials.get(material_name)
@@ -179,6 +181,7 @@ class MaterialTools:
             "message": f"Properties updated for '{material_name}'",
         }
 
+    @tool()
     def assign_material(
         self,
         material_name,
@@ -202,7 +205,7 @@ class MaterialTools:
         if pattern:
             patterns = [pattern] if isinstance(pattern, str) else pattern
             for p in patterns:
-                matches = fnmatch.filter(bpy.data.objects.keys(), p)
+                matches = self.scene_index.glob(p)
                 target_names.update(matches)
 
         # Process collection
@@ -220,7 +223,7 @@ class MaterialTools:
                 object_names = [object_names]
             for name in object_names:
                 if "*" in name or "?" in name:
-                    matches = fnmatch.filter(bpy.data.objects.keys(), name)
+                    matches = self.scene_index.glob(name)
                     target_names.update(matches)
                 else:
                     target_names.add(name)
@@ -247,6 +250,7 @@ class MaterialTools:
             "message": f"Material '{material_name}' assigned to {count} objects. TASK COMPLETE. Do not perform redundant steps.",
         }
 
+    @tool()
     def add_shader_node(self, material_name, node_type, location, params=None):
         mat = bpy.data.materials.get(material_name)
         if not mat:
@@ -265,6 +269,7 @@ class MaterialTools:
             "message": f"Added node '{node.name}' to '{material_name}'",
         }
 
+    @tool()
     def connect_shader_nodes(
         self, material_name, from_node, from_socket, to_node, to_socket
     ):
@@ -274,6 +279,7 @@ class MaterialTools:
         mat.node_tree.links.new(from_n.outputs[from_socket], to_n.inputs[to_socket])
         return {"success": True, "message": f"Connected nodes in '{material_name}'"}
 
+    @tool()
     def assign_builtin_texture(self, material_name, texture_type):
         mat = bpy.data.materials.get(material_name)
         if not mat.use_nodes:
@@ -288,6 +294,7 @@ class MaterialTools:
             "message": f"Assigned {texture_type} texture to '{material_name}'",
         }
 
+    @tool()
     def assign_texture_map(self, material_name, image_path, map_type="Base Color"):
         """
         Load an image and assign it to a material slot.
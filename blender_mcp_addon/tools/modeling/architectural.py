@@ -3,9 +3,12 @@ import bmesh
 import math
 import mathutils
 from ...utils import get_object, get_collection
+from ...registry import tool
+from ...scheduler import LONG
 
 
 class ModelingArchitectural:
+    @tool()
     def build_wall_segment(
         self,
         start_point,
@@ -75,6 +78,7 @@ class ModelingArchitectural:
             ),
         }
 
+    @tool(lane=LONG)
     def build_room_shell(
         self,
         vertices,
@@ -289,6 +293,7 @@ class ModelingArchitectural:
             ),
         }
 
+    @tool()
     def toggle_ceiling(self, object_name, visible=False, **kwargs):
         """Show or hide an object (intended for ceiling objects)."""
         obj = get_object(object_name)
@@ -303,6 +308,7 @@ class ModelingArchitectural:
             "message": f"'{object_name}' is now {state} in viewport and render.",
         }
 
+    @tool()
     def build_wall_with_door(
         self,
         start_point,
@@ -484,6 +490,7 @@ class ModelingArchitectural:
             ),
         }
 
+    @tool()
     def set_view(self, mode="TOP", **kwargs):
         """Switch viewport view (best effort)"""
         valid_modes = ["TOP", "ISO", "FRONT", "SIDE"]
@@ -556,6 +563,7 @@ class ModelingArchitectural:
             "message": f"View mode set to {mode}. (AI: Working in {mode} mode)",
         }
 
+    @tool()
     def build_column(
         self,
         location,
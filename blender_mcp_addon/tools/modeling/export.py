@@ -0,0 +1,142 @@
+import math
+import os
+
+import bpy
+import numpy as np
+from ...arrays import ENCODINGS, encode, mesh_arrays, mesh_chunk
+from ...utils import get_object
+from ...registry import tool
+from ...scheduler import LONG
+
+# Vertices (and polygons) per inline chunk; larger meshes take several calls
+DEFAULT_MESH_CHUNK = 250_000
+
+
+class ModelingExport:
+    def _packed_mesh(self, obj, evaluated, world_space, normals):
+        """mesh_arrays of an object, reused until the scene index sees a change.
+
+        Chunked exports call once per chunk; packing once per revision keeps
+        a k-chunk export at one evaluation instead of k.
+        """
+        index = self.scene_index
+        index.sync()
+        cache_key = (
+            obj.as_pointer(),
+            obj.name,
+            bool(evaluated),
+            bool(world_space),
+            bool(normals),
+            index.journal.revision,
+            index.rebuilds,  # Undo can restore geometry without a new revision
+        )
+        cached = self._mesh_export_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        if evaluated:
+            # Geometry after modifiers, shape keys and constraints
+            source = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+            mesh = source.to_mesh()
+            if mesh is None:
+                source.to_mesh_clear()
+                raise ValueError(
+                    f"Object '{obj.name}' is a {obj.type} with no geometry to export"
+                )
+        elif obj.type == "MESH":
+            source, mesh = None, obj.data
+        else:
+            raise ValueError(
+                f"Object '{obj.name}' is a {obj.type}, not a MESH. Use evaluated=true to convert it."
+            )
+
+        try:
+            data = mesh_arrays(mesh, normals)
+        finally:
+            if source is not None:
+                source.to_mesh_clear()
+
+        matrix = np.array(obj.matrix_world)
+        if world_space:
+            vertices = data["vertices"] @ matrix[:3, :3].T + matrix[:3, 3]
+            data["vertices"] = vertices.astype(np.float32)
+            if normals:
+                # Normals transform by the inverse transpose, then renormalize
+                normal_matrix = np.linalg.inv(matrix[:3, :3]).T
+                for key in ("vertex_normals", "polygon_normals"):
+                    rotated = data[key] @ normal_matrix.T
+                    lengths = np.linalg.norm(rotated, axis=1, keepdims=True)
+                    data[key] = (rotated / np.maximum(lengths, 1e-12)).astype(
+                        np.float32
+                    )
+        # One mesh at a time, so a large export does not pin several copies
+        self._mesh_export_cache = (cache_key, data, matrix)
+        return data, matrix
+
+    @tool(read_only=True, lane=LONG)
+    def export_mesh_data(
+        self,
+        name,
+        evaluated=False,
+        world_space=False,
+        normals=True,
+        path=None,
+        encoding="base64",
+        chunk=0,
+        chunk_size=DEFAULT_MESH_CHUNK,
+    ):
+        """Export a mesh's vertices, polygons and normals as binary buffers"""
+        obj = get_object(name)
+        if encoding not in ENCODINGS:
+            raise ValueError(
+                f"Unknown encoding '{encoding}'. Use: {', '.join(ENCODINGS)}"
+            )
+        data, matrix = self._packed_mesh(obj, evaluated, world_space, normals)
+
+        counts = {
+            "vertices": len(data["vertices"]),
+            "polygons": len(data["polygon_sizes"]),
+            "loops": len(data["polygon_vertices"]),
+        }
+        info = {
+            "success": True,
+            "name": obj.name,
+            "evaluated": bool(evaluated),
+            "world_space": bool(world_space),
+            "counts": counts,
+            "matrix_world": matrix.tolist(),
+        }
+
+        if path:
+            path = os.path.abspath(bpy.path.abspath(path))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.savez(path, matrix_world=matrix, **data)
+            if not path.endswith(".npz"):
+                path += ".npz"  # np.savez adds the extension itself
+            info["path"] = path
+            info["message"] = (
+                f"Wrote {counts['vertices']} vertices and {counts['polygons']} polygons of '{obj.name}' to {path}"
+            )
+            return info
+
+        chunk_size = max(1, int(chunk_size))
+        chunks = max(
+            1, math.ceil(max(counts["vertices"], counts["polygons"]) / chunk_size)
+        )
+        chunk = int(chunk)
+        if not 0 <= chunk < chunks:
+            raise ValueError(f"chunk must be between 0 and {chunks - 1}")
+        part = mesh_chunk(data, chunk, chunk_size)
+        info.update(
+            {
+                "encoding": encoding,
+                "chunk": chunk,
+                "chunks": chunks,
+                "next_chunk": chunk + 1 if chunk + 1 < chunks else None,
+                "arrays": {key: encode(array, encoding) for key, array in part.items()},
+            }
+        )
+        info["message"] = (
+            f"Exported chunk {chunk + 1} of {chunks} of '{obj.name}' ({counts['vertices']} vertices, {counts['polygons']} polygons)"
+        )
+        return info
@@ -1,8 +1,11 @@
 import bpy
 from ...utils import get_object
+from ...registry import tool
+from ...scheduler import LONG
 
 
 class ModelingModifiers:
+    @tool()
     def apply_modifier(
         self,
         object_name,
@@ -102,6 +105,7 @@ class ModelingModifiers:
             "message": f"Applied modifier '{mod.name}' to '{object_name}'.",
         }
 
+    @tool()
     def copy_modifier(
         self,
         source_object,
@@ -176,6 +180,7 @@ class ModelingModifiers:
             "message": f"Copied modifier '{modifier_name}' to {count} object(s)",
         }
 
+    @tool()
     def remove_modifier(self, object_name, modifier_name):
         obj = get_object(object_name)
         mod = obj.modifiers.get(modifier_name)
@@ -187,6 +192,7 @@ class ModelingModifiers:
             "message": f"Modifier '{modifier_name}' removed from '{object_name}'",
         }
 
+    @tool(lane=LONG)
     def boolean_operation(
         self,
         object_a,
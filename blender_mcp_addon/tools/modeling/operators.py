@@ -2,9 +2,12 @@ import bpy
 import math
 import random
 from ...utils import get_object, get_collection
+from ...registry import tool
+from ...scheduler import LONG
 
 
 class ModelingOperators:
+    @tool()
     def create_and_array(
         self,
         primitive_type,
@@ -43,6 +46,7 @@ class ModelingOperators:
             "message": f"Created '{obj_name}' with array modifier.",
         }
 
+    @tool()
     def circular_array(
         self,
         object_name,
@@ -61,6 +65,7 @@ class ModelingOperators:
         created = []
         angle_step = 360.0 / count
         for i in range(count):
+            self.check_cancelled()
             angle_rad = math.radians(start_angle + i * angle_step)
             if axis == "Z":
                 x, y, z = (
@@ -140,6 +145,7 @@ class ModelingOperators:
             "message": f"Created circular array of {count} objects and selected them: ({summary}). All geometry verified. Proceed immediately to next modeling step.",
         }
 
+    @tool(lane=LONG)
     def join_objects(
         self,
         object_names=None,
@@ -177,6 +183,7 @@ class ModelingOperators:
             "message": f"Joined objects into '{res.name}'",
         }
 
+    @tool()
     def random_distribute(
         self,
         object_name,
@@ -193,6 +200,7 @@ class ModelingOperators:
         dist_center = center if center else obj.location
         created = []
         for _ in range(count):
+            self.check_cancelled()
             while True:
                 # Calculate relative offset
                 off_x, off_y = (
@@ -261,6 +269,7 @@ class ModelingOperators:
 
         return selected_count
 
+    @tool()
     def extrude_mesh(
         self,
         object_name,
@@ -301,6 +310,7 @@ class ModelingOperators:
             "message": f"Extruded {mode.lower()} of '{object_name}' by {move}. Geometry verified. Proceed immediately to next modeling step.",
         }
 
+    @tool()
     def inset_faces(
         self,
         object_name,
@@ -337,6 +347,7 @@ class ModelingOperators:
             "message": f"Inset faces of '{object_name}' by {thickness}. Geometry verified. Proceed immediately to next modeling step.",
         }
 
+    @tool()
     def shear_mesh(
         self,
         object_name,
@@ -403,6 +414,7 @@ class ModelingOperators:
             "message": f"Sheared '{object_name}' on {axis} axis by {value}.",
         }
 
+    @tool()
     def delete_object(self, object_name=None, pattern=None, **kwargs):
         """Delete object(s) by name or pattern. Handles hidden objects."""
         import bpy
@@ -415,8 +427,9 @@ class ModelingOperators:
         objects_to_delete = []
         if pattern:
             # 1. Collect matching objects from all objects in the blend file
-            for obj in bpy.data.objects:
-                if fnmatch.fnmatch(obj.name, pattern):
+            for name in self.scene_index.glob(pattern):
+                obj = bpy.data.objects.get(name)
+                if obj:
                     objects_to_delete.append(obj)
 
             # 2. Collect matching collections
@@ -433,13 +446,8 @@ class ModelingOperators:
 
             # Delete collections
             for coll in collections_to_remove:
-                # Unlink from parents/scene
-                for parent in bpy.data.collections:
-                    if coll.name in parent.children:
-                        parent.children.unlink(coll)
-                if coll.name in bpy.context.scene.collection.children:
-                    bpy.context.scene.collection.children.unlink(coll)
-                bpy.data.collections.remove(coll)
+                # do_unlink detaches it from every parent and scene in one pass
+                bpy.data.collections.remove(coll, do_unlink=True)
 
             return {
                 "success": True,
@@ -1,9 +1,11 @@
 import bpy
 import math
 from ...utils import get_collection
+from ...registry import tool
 
 
 class ModelingPrimitives:
+    @tool()
     def create_cube(
         self,
         location,
@@ -24,6 +26,7 @@ class ModelingPrimitives:
             **kwargs,
         )
 
+    @tool()
     def create_cylinder(
         self,
         location,
@@ -51,6 +54,7 @@ class ModelingPrimitives:
         params.update(kwargs)
         return self.create_primitive("cylinder", location, **params)
 
+    @tool()
     def create_icosphere(
         self,
         location,
@@ -75,6 +79,7 @@ class ModelingPrimitives:
             **kwargs,
         )
 
+    @tool()
     def create_sphere(
         self,
         location,
@@ -95,6 +100,7 @@ class ModelingPrimitives:
             radius=radius,
         )
 
+    @tool()
     def create_torus(
         self,
         location,
@@ -121,6 +127,7 @@ class ModelingPrimitives:
             minor_segments=minor_segments,
         )
 
+    @tool()
     def create_text(
         self,
         text,
@@ -166,6 +173,7 @@ class ModelingPrimitives:
             "message": f"Text object '{obj.name}' {status} successfully.",
         }
 
+    @tool()
     def create_plane(
         self,
         location,
@@ -186,6 +194,7 @@ class ModelingPrimitives:
             size=size,
         )
 
+    @tool(internal=True)
     def create_primitive(
         self,
         type,
@@ -245,12 +254,13 @@ class ModelingPrimitives:
                 # Note: This is an approximation for existing objects without rebuilding mesh
                 pass
         else:
-            existing_objects = {obj.name for obj in bpy.data.objects}
+            count = len(bpy.data.objects)
             op(**params)
-            new_objects = [
-                obj for obj in bpy.data.objects if obj.name not in existing_objects
-            ]
-            obj = new_objects[0] if new_objects else bpy.context.object
+            # Primitive operators make the new object active
+            if len(bpy.data.objects) > count:
+                obj = bpy.context.view_layer.objects.active
+            else:
+                obj = bpy.context.object
 
         if not obj:
             raise RuntimeError("Failed to identify or update object")
@@ -1,9 +1,10 @@
 import bpy
-import fnmatch
 from ...utils import get_object
+from ...registry import tool
 
 
 class ModelingSelection:
+    @tool()
     def select_objects(self, object_names, active_object=None):
         if isinstance(object_names, str):
             object_names = [object_names]
@@ -13,7 +14,7 @@ class ModelingSelection:
         expanded_names = []
         for name in object_names:
             if "*" in name or "?" in name:
-                matches = fnmatch.filter(bpy.data.objects.keys(), name)
+                matches = self.scene_index.glob(name)
                 expanded_names.extend(matches)
             else:
                 expanded_names.append(name)
@@ -27,6 +28,7 @@ class ModelingSelection:
             "message": f"Selected {len(expanded_names)} objects. TIP: If your goal is material assignment, use 'create_material(..., pattern=\"*\")' instead to avoid rate limits.",
         }
 
+    @tool()
     def select_by_pattern(self, pattern, extend=False, **kwargs):
         """Select objects matching a glob pattern (e.g. 'Facade_Fin*')"""
         # Ensure we're in Object mode
@@ -67,6 +69,7 @@ class ModelingSelection:
             "message": f"Selected {len(selected)} object(s) matching '{pattern}': ({summary}){greedy_note}. TIP: For materials, use the 'pattern' parameter inside the material tool directly.",
         }
 
+    @tool()
     def invert_mesh_selection(self, object_name, **kwargs):
         """Invert selection of mesh components (verts/edges/faces)"""
         from ...utils import get_object
@@ -1,9 +1,11 @@
 import bpy
 import math
 from ...utils import get_object, get_collection
+from ...registry import tool
 
 
 class ModelingTransforms:
+    @tool()
     def duplicate_object(
         self,
         object_name,
@@ -74,6 +76,7 @@ class ModelingTransforms:
             "message": f"Object {status_msg}. Geometry verified. Proceed immediately to next modeling step.",
         }
 
+    @tool()
     def duplicate_selection(
         self,
         location_offset=None,
@@ -137,10 +140,12 @@ class ModelingTransforms:
             "message": f"Duplicated {len(duplicated)} selected object(s): {', '.join(duplicated)}",
         }
 
+    @tool()
     def batch_transform(self, transforms):
         """Transform multiple objects at once"""
         results = []
         for transform in transforms:
+            self.check_cancelled()
             obj_name = transform.get("object_name")
             if not obj_name:
                 continue
@@ -158,6 +163,7 @@ class ModelingTransforms:
             "message": f"Successfully batch-transformed {len(results)} object(s).",
         }
 
+    @tool()
     def transform_object(
         self,
         object_name,
@@ -185,6 +191,7 @@ class ModelingTransforms:
             "message": f"Transformed object '{object_name}'",
         }
 
+    @tool()
     def set_object_dimensions(self, object_name, x, y, z):
         obj = get_object(object_name)
         obj.dimensions = (x, y, z)
@@ -1,7 +1,14 @@
+import os
+import tempfile
 import bpy
 
+from ..render_workers import CPU_ENGINES, RenderWorkerPool, split_frames
+from ..registry import tool
+from ..scheduler import LONG
+
 
 class RenderingTools:
+    @tool()
     def configure_render_settings(
         self,
         engine=None,
@@ -33,11 +40,28 @@ class RenderingTools:
             "message": "Render settings updated",
         }
 
-    def render_frame(self, output_path=None):
+    @tool(lane=LONG, undo=False)
+    def render_frame(self, output_path=None, as_job=False):
         """Render current frame"""
         if output_path:
             bpy.context.scene.render.filepath = output_path
 
+        if as_job:
+            frame = bpy.context.scene.frame_current
+            job = self.jobs.submit(
+                "render_frame",
+                self._render_frames(
+                    [frame], bpy.context.scene.render.filepath, still=True
+                ),
+                total=1,
+                params={"frame": frame, "output_path": output_path},
+            )
+            return {
+                "success": True,
+                "job_id": job.id,
+                "message": f"Render job '{job.id}' queued. Poll get_job_status('{job.id}') for progress.",
+            }
+
         bpy.ops.render.render(write_still=True)
 
         return {
@@ -46,7 +70,16 @@ class RenderingTools:
             "message": "Frame rendered",
         }
 
-    def render_animation(self, start_frame=None, end_frame=None, output_dir=None):
+    @tool(lane=LONG, undo=False)
+    def render_animation(
+        self,
+        start_frame=None,
+        end_frame=None,
+        output_dir=None,
+        as_job=False,
+        workers=None,
+        engine=None,
+    ):
         """Render animation"""
         scene = bpy.context.scene
 
@@ -57,6 +90,30 @@ class RenderingTools:
         if output_dir:
             scene.render.filepath = output_dir
 
+        if workers:
+            return self._render_with_workers(workers, engine, output_dir)
+
+        if as_job:
+            frames = list(
+                range(scene.frame_start, scene.frame_end + 1, scene.frame_step)
+            )
+            job = self.jobs.submit(
+                "render_animation",
+                self._render_frames(frames, scene.render.filepath),
+                total=len(frames),
+                params={
+                    "start_frame": scene.frame_start,
+                    "end_frame": scene.frame_end,
+                    "output_dir": output_dir,
+                },
+            )
+            return {
+                "success": True,
+                "job_id": job.id,
+                "frames": f"{scene.frame_start}-{scene.frame_end}",
+                "message": f"Render job '{job.id}' queued for {len(frames)} frame(s). Poll get_job_status('{job.id}') for progress.",
+            }
+
         bpy.ops.render.render(animation=True)
 
         return {
@@ -64,3 +121,112 @@ class RenderingTools:
             "frames": f"{scene.frame_start}-{scene.frame_end}",
             "message": "Animation render started",
         }
+
+    def _render_with_workers(self, workers, engine, output_dir):
+        """Render the frame range in headless `blender -b` processes as a job"""
+        scene = bpy.context.scene
+        engine = engine or scene.render.engine
+        if engine not in CPU_ENGINES:
+            raise ValueError(
+                f"Render workers need a CPU engine {CPU_ENGINES}, got '{engine}'"
+            )
+        chunks = split_frames(
+            scene.frame_start, scene.frame_end, scene.frame_step, int(workers)
+        )
+        if not chunks:
+            raise ValueError("Frame range is empty")
+
+        # Workers render from a snapshot so later edits don't leak into the job
+        snapshot = os.path.join(tempfile.mkdtemp(prefix="mcp_render_"), "scene.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True, check_existing=False)
+
+        threads = max(1, (os.cpu_count() or 1) // len(chunks))
+        pool = RenderWorkerPool(
+            bpy.app.binary_path,
+            snapshot,
+            bpy.path.abspath(scene.render.filepath),
+            chunks,
+            engine=engine,
+            threads=threads,
+            step=scene.frame_step,
+        )
+        total = sum(len(chunk) for chunk in chunks)
+        job = self.jobs.submit(
+            "render_animation",
+            pool.run(),
+            total=total,
+            params={
+                "start_frame": scene.frame_start,
+                "end_frame": scene.frame_end,
+                "output_dir": output_dir,
+                "workers": len(chunks),
+                "engine": engine,
+            },
+            describe=pool.describe,
+            cleanup=pool.cleanup,
+        )
+        return {
+            "success": True,
+            "job_id": job.id,
+            "frames": f"{scene.frame_start}-{scene.frame_end}",
+            "workers": len(chunks),
+            "message": f"Render job '{job.id}' started on {len(chunks)} headless worker(s) ({engine}, {threads} thread(s) each). Poll get_job_status('{job.id}') for per-worker progress.",
+        }
+
+    def _render_frames(self, frames, filepath, still=False):
+        """Render one frame per step so other commands run in between"""
+        for frame in frames:
+            scene = bpy.context.scene
+            previous_frame, previous_path = scene.frame_current, scene.render.filepath
+            try:
+                scene.frame_set(frame)
+                if still:
+                    output = bpy.path.abspath(filepath)
+                else:
+                    # Same per-frame file name an animation render would write
+                    scene.render.filepath = filepath
+                    output = bpy.path.abspath(scene.render.frame_path(frame=frame))
+                scene.render.filepath = output
+                bpy.ops.render.render(write_still=True)
+            finally:
+                scene.render.filepath = previous_path
+                scene.frame_set(previous_frame)
+            yield {"frame": frame, "path": output}
+
+    @tool(read_only=True)
+    def get_job_status(self, job_id=None):
+        """Get progress of one job, or of every job when no id is given"""
+        if job_id is None:
+            jobs = [job.to_dict() for job in self.jobs.all()]
+            return {
+                "success": True,
+                "jobs": jobs,
+                "message": f"{len(jobs)} job(s) tracked.",
+            }
+        job = self.jobs.get(job_id)
+        info = job.to_dict()
+        info["success"] = True
+        info["message"] = (
+            f"Job '{job.id}' is {job.state} ({job.done}/{job.total} steps)."
+        )
+        return info
+
+    @tool(read_only=True)
+    def get_job_output(self, job_id):
+        """Get the files produced by a job so far"""
+        job = self.jobs.get(job_id)
+        info = job.to_dict(include_outputs=True)
+        info["success"] = True
+        info["message"] = f"Job '{job.id}' has {len(job.outputs)} output(s)."
+        return info
+
+    @tool(read_only=True)
+    def cancel_job(self, job_id):
+        """Stop a job after its current step"""
+        job = self.jobs.cancel(job_id)
+        return {
+            "success": True,
+            "job_id": job.id,
+            "state": job.state,
+            "message": f"Job '{job.id}' is {job.state}; completed steps are kept.",
+        }
@@ -1,33 +1,210 @@
+import bisect
+import json
+import os
 import bpy
 import math
-from ..utils import get_object
+from ..arrays import ENCODINGS, encode, gather, gather_matrices, positions, world_aabbs
+from ..utils import get_object, world_bbox
+from ..registry import tool
+
+DEFAULT_SCENE_FIELDS = ("name", "type", "location")
+SCENE_FIELDS = (
+    "name",
+    "type",
+    "location",
+    "rotation",
+    "scale",
+    "dimensions",
+    "parent",
+    "collections",
+    "bbox",
+    "vertices",
+    "faces",
+    "modifiers",
+    "materials",
+)
+# Same content as get_object_info, one column per field
+DEFAULT_OBJECTS_FIELDS = (
+    "type",
+    "location",
+    "rotation",
+    "scale",
+    "dimensions",
+    "vertices",
+    "faces",
+    "modifiers",
+)
+TRANSFORM_FIELDS = ("location", "rotation", "scale", "dimensions", "bbox")
+MAX_SCENE_PAGE = 1000
+# Objects written per timer tick when streaming the scene to a file
+SCENE_STREAM_CHUNK = 500
+
+
+def _find_collection(name):
+    coll = bpy.data.collections.get(name)
+    if not coll:
+        raise ValueError(f"Collection '{name}' not found")
+    return coll
+
+
+def _check_fields(fields):
+    unknown = [field for field in fields if field not in SCENE_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) {', '.join(unknown)}. Use: {', '.join(SCENE_FIELDS)}"
+        )
+
+
+def _modifier_info(mod):
+    info = {
+        "name": mod.name,
+        "type": mod.type,
+        "show_viewport": mod.show_viewport,
+        "show_render": mod.show_render,
+    }
+    # Add type-specific info if needed
+    if mod.type == "MIRROR":
+        info["use_axis"] = list(mod.use_axis)
+    elif mod.type == "ARRAY":
+        info["count"] = mod.count
+    return info
+
+
+def _project(obj, fields):
+    """The requested fields of one object"""
+    info = {}
+    for field in fields:
+        if field == "name":
+            info["name"] = obj.name
+        elif field == "type":
+            info["type"] = obj.type
+        elif field == "location":
+            info["location"] = list(obj.location)
+        elif field == "rotation":
+            info["rotation"] = list(obj.rotation_euler)
+        elif field == "scale":
+            info["scale"] = list(obj.scale)
+        elif field == "dimensions":
+            info["dimensions"] = list(obj.dimensions)
+        elif field == "parent":
+            info["parent"] = obj.parent.name if obj.parent else None
+        elif field == "collections":
+            info["collections"] = [c.name for c in obj.users_collection]
+        elif field == "bbox":
+            low, high = world_bbox(obj)
+            info["bbox"] = {"min": low, "max": high}
+        elif field == "vertices":
+            info["vertices"] = len(obj.data.vertices) if obj.type == "MESH" else None
+        elif field == "faces":
+            info["faces"] = len(obj.data.polygons) if obj.type == "MESH" else None
+        elif field == "modifiers":
+            info["modifiers"] = [_modifier_info(mod) for mod in obj.modifiers]
+        elif field == "materials":
+            info["materials"] = [
+                slot.material.name if slot.material else None
+                for slot in obj.material_slots
+            ]
+    return info
+
+
+def _write_scene_chunks(names, fields, path):
+    """Job steps writing one NDJSON line per object, a chunk at a time"""
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, len(names), SCENE_STREAM_CHUNK):
+            for name in names[start : start + SCENE_STREAM_CHUNK]:
+                obj = bpy.data.objects.get(name)
+                if obj is None:
+                    continue  # Deleted since the export started
+                f.write(json.dumps(_project(obj, fields)) + "\n")
+                written += 1
+            f.flush()
+            yield {"path": path, "written": written}
 
 
 class SceneTools:
-    def get_scene_info(self):
-        """Get information about the current Blender scene"""
+    @tool(read_only=True)
+    def get_scene_info(
+        self,
+        limit=100,
+        cursor=None,
+        type=None,
+        collection=None,
+        name=None,
+        region=None,
+        fields=None,
+        stream_to=None,
+    ):
+        """Get information about the current Blender scene, one page at a time"""
+        fields = list(fields or DEFAULT_SCENE_FIELDS)
+        _check_fields(fields)
+        scene = bpy.context.scene
+        names = self._filter_scene_objects(type, collection, name, region)
+
+        if stream_to:
+            return self._stream_scene_info(names, fields, stream_to)
+
+        limit = max(1, min(int(limit), MAX_SCENE_PAGE))
+        start = bisect.bisect_right(names, cursor) if cursor else 0
+        page = names[start : start + limit]
+        next_cursor = page[-1] if start + limit < len(names) else None
+        # Skip names left behind by a rename the index has not seen yet
+        objects = [bpy.data.objects.get(n) for n in page]
+
         scene_info = {
-            "name": bpy.context.scene.name,
-            "object_count": len(bpy.context.scene.objects),
-            "objects": [],
+            "name": scene.name,
+            "object_count": len(scene.objects),
+            "matched": len(names),
+            "objects": [_project(obj, fields) for obj in objects if obj],
+            "next_cursor": next_cursor,
+            "revision": self.scene_index.journal.revision,
             "collections": [c.name for c in bpy.data.collections],
         }
-
-        for obj in bpy.context.scene.objects[:100]:
-            scene_info["objects"].append(
-                {
-                    "name": obj.name,
-                    "type": obj.type,
-                    "location": list(obj.location),
-                }
-            )
-
         scene_info["success"] = True
         scene_info["message"] = (
-            f"Retrieved scene info for '{bpy.context.scene.name}'. Found {scene_info['object_count']} objects across {len(scene_info['collections'])} collections."
+            f"Retrieved scene info for '{scene.name}'. Found {scene_info['object_count']} objects across {len(scene_info['collections'])} collections; returned {len(page)}"
+            + (f", more after cursor '{next_cursor}'." if next_cursor else ".")
         )
         return scene_info
 
+    def _filter_scene_objects(self, type, collection, name, region):
+        """Names of scene objects matching every given filter, sorted"""
+        index = self.scene_index
+        names = index.in_scene(bpy.context.scene.name)
+        if collection:
+            names &= index.in_collection(_find_collection(collection))
+        if type:
+            types = {t.upper() for t in ([type] if isinstance(type, str) else type)}
+            names &= index.of_type(types)
+        if name:
+            names &= set(index.glob(name))
+        if region:
+            names = index.overlapping(region["min"], region["max"], names)
+        return sorted(names)
+
+    def _stream_scene_info(self, names, fields, path):
+        """Write matching objects as NDJSON from a job, a chunk per timer tick"""
+        # Blender-relative "//" paths resolve against the .blend file
+        path = os.path.abspath(bpy.path.abspath(path))
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            raise ValueError(f"stream_to directory '{directory}' does not exist")
+        chunks = math.ceil(len(names) / SCENE_STREAM_CHUNK)
+        job = self.jobs.submit(
+            "get_scene_info",
+            _write_scene_chunks(names, fields, path),
+            total=chunks,
+            params={"stream_to": path, "objects": len(names), "fields": fields},
+        )
+        return {
+            "success": True,
+            "job_id": job.id,
+            "path": path,
+            "matched": len(names),
+            "message": f"Streaming {len(names)} object(s) to '{path}' as job '{job.id}'. Poll get_job_status('{job.id}') until it completes.",
+        }
+
+    @tool(read_only=True)
     def get_object_info(self, name):
         """Get detailed information about a specific object"""
         obj = get_object(name)
@@ -45,20 +222,7 @@ class SceneTools:
             info["vertices"] = len(obj.data.vertices)
             info["faces"] = len(obj.data.polygons)
 
-        info["modifiers"] = []
-        for mod in obj.modifiers:
-            mod_info = {
-                "name": mod.name,
-                "type": mod.type,
-                "show_viewport": mod.show_viewport,
-                "show_render": mod.show_render,
-            }
-            # Add type-specific info if needed
-            if mod.type == "MIRROR":
-                mod_info["use_axis"] = list(mod.use_axis)
-            elif mod.type == "ARRAY":
-                mod_info["count"] = mod.count
-            info["modifiers"].append(mod_info)
+        info["modifiers"] = [_modifier_info(mod) for mod in obj.modifiers]
 
         info["success"] = True
         info["message"] = (
@@ -66,6 +230,128 @@ class SceneTools:
         )
         return info
 
+    @tool(read_only=True)
+    def get_objects_info(
+        self, names=None, pattern=None, fields=None, limit=MAX_SCENE_PAGE, cursor=None
+    ):
+        """Get information about many objects at once, one column per field"""
+        if not names and not pattern:
+            raise ValueError("Give a list of object names, a name pattern, or both")
+        fields = [f for f in (fields or DEFAULT_OBJECTS_FIELDS) if f != "name"]
+        _check_fields(fields)
+
+        wanted = set(self.scene_index.glob(pattern)) if pattern else set()
+        missing = []
+        for name in names or ():
+            if self.scene_index.get(name):
+                wanted.add(name)
+            else:
+                missing.append(name)
+        matched = sorted(wanted)
+
+        limit = max(1, min(int(limit), MAX_SCENE_PAGE))
+        start = bisect.bisect_right(matched, cursor) if cursor else 0
+        page = matched[start : start + limit]
+        next_cursor = page[-1] if start + limit < len(matched) else None
+
+        columns = {field: [] for field in fields}
+        found = []
+        for name in page:
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                missing.append(name)  # Renamed since the glob matched it
+                continue
+            found.append(name)
+            row = _project(obj, fields)
+            for field in fields:
+                columns[field].append(row[field])
+
+        return {
+            "success": True,
+            "matched": len(matched),
+            "names": found,
+            "columns": columns,
+            "missing": missing,
+            "next_cursor": next_cursor,
+            "revision": self.scene_index.journal.revision,
+            "message": f"Retrieved {len(fields)} field(s) for {len(found)} of {len(matched)} object(s)"
+            + (f"; not found: {', '.join(missing)}" if missing else "")
+            + (f"; more after cursor '{next_cursor}'." if next_cursor else "."),
+        }
+
+    @tool(read_only=True)
+    def get_object_transforms(
+        self,
+        type=None,
+        collection=None,
+        name=None,
+        region=None,
+        fields=None,
+        encoding="list",
+    ):
+        """Transforms and world bounding boxes of all matching objects, as arrays"""
+        fields = list(fields or TRANSFORM_FIELDS)
+        unknown = [field for field in fields if field not in TRANSFORM_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s) {', '.join(unknown)}. Use: {', '.join(TRANSFORM_FIELDS)}"
+            )
+        if encoding not in ENCODINGS:
+            raise ValueError(
+                f"Unknown encoding '{encoding}'. Use: {', '.join(ENCODINGS)}"
+            )
+        names = self._filter_scene_objects(type, collection, name, region)
+
+        # One foreach_get per property over every object, then pick the rows
+        objects = bpy.data.objects
+        names = [name for name in names if objects.get(name) is not None]
+        rows = positions(objects, names)
+        arrays = {}
+        for field in fields:
+            if field == "bbox":
+                matrices = gather_matrices(objects)[rows]
+                corners = gather(objects, "bound_box", 24).reshape(-1, 8, 3)[rows]
+                low, high = world_aabbs(matrices, corners)
+                arrays["bbox_min"] = encode(low, encoding)
+                arrays["bbox_max"] = encode(high, encoding)
+            else:
+                attribute = "rotation_euler" if field == "rotation" else field
+                values = gather(objects, attribute, 3).reshape(-1, 3)[rows]
+                arrays[field] = encode(values, encoding)
+
+        return {
+            "success": True,
+            "count": len(names),
+            "names": names,
+            "encoding": encoding,
+            "arrays": arrays,
+            "revision": self.scene_index.journal.revision,
+            "message": f"Exported {', '.join(fields)} for {len(names)} object(s) as {encoding}.",
+        }
+
+    @tool(read_only=True)
+    def get_scene_changes(self, since=0):
+        """Objects added, removed or modified after a scene revision"""
+        self.scene_index.sync()
+        journal = self.scene_index.journal
+        changes = journal.changes_since(int(since))
+        if changes is None:
+            return {
+                "success": True,
+                "revision": journal.revision,
+                "reset": True,
+                "message": f"Revision {since} is no longer in the change journal (now at {journal.revision}). Re-fetch the scene with get_scene_info.",
+            }
+        counts = ", ".join(f"{len(names)} {kind}" for kind, names in changes.items())
+        return {
+            "success": True,
+            "revision": journal.revision,
+            "reset": False,
+            **changes,
+            "message": f"Changes from revision {since} to {journal.revision}: {counts}.",
+        }
+
+    @tool(read_only=True)
     def get_distance(self, object_a, object_b, mode="CENTER"):
         """Measure distance between two objects"""
         obj_a = get_object(object_a)
@@ -87,6 +373,7 @@ class SceneTools:
             "message": f"Distance ({mode}): {dist:.4f}",
         }
 
+    @tool(read_only=True)
     def get_viewport_screenshot(self, max_size=800):
         """Capture viewport screenshot (placeholder for now as it needs context)"""
         # In a real addon, this would use bpy.ops.view3d.screenshot
@@ -96,3 +383,85 @@ class SceneTools:
             "message": "Screenshot captured (Simulated)",
             "notice": "Viewport capture requires active window context",
         }
+
+    @tool(read_only=True)
+    def get_debug_info(self):
+        """Get diagnostic information about the MCP server"""
+        lanes = self.scheduler.stats()
+        depth = sum(lane["depth"] for lane in lanes.values())
+        return {
+            "success": True,
+            "running": self.running,
+            "queue_depth": depth,
+            "lanes": lanes,
+            "limits": {
+                "max_queue_depth": self.scheduler.max_depth,
+                "rejected_commands": self.scheduler.rejected,
+                "max_connections": self.max_connections,
+                "active_connections": self.active_connections,
+                "rejected_connections": self.rejected_connections,
+            },
+            "scene_index": self.scene_index.stats(),
+            "jobs": {
+                "active": sum(1 for job in self.jobs.all() if not job.finished),
+                "tracked": len(self.jobs.all()),
+            },
+            "cancellation": {
+                "cancelled_before_start": self.scheduler.cancelled_before_start,
+                "cancelled_during_run": self.scheduler.cancelled_during_run,
+                "finished_late": self.scheduler.finished_late,
+            },
+            "undo": self.undo_info(),
+            "scheduler": {
+                "tick_budget_ms": self.tick_budget * 1000.0,
+                "max_idle_interval_ms": self.max_idle_interval * 1000.0,
+                **self.tick_stats.snapshot(),
+            },
+            "message": f"MCP server running with {depth} queued command(s).",
+        }
+
+    @tool(read_only=True)
+    def get_tool_manifest(self):
+        """Registered command handlers, for checking against the bridge's schemas"""
+        tools = [spec.to_dict() for spec in self.tools.values()]
+        return {
+            "success": True,
+            "tools": sorted(tools, key=lambda spec: spec["name"]),
+            "message": f"{len(tools)} tool handler(s) registered.",
+        }
+
+    @tool(read_only=True)
+    def configure_scheduler(
+        self,
+        tick_budget_ms=None,
+        max_idle_interval_ms=None,
+        max_queue_depth=None,
+        max_connections=None,
+    ):
+        """Tune main-thread time slicing and admission limits"""
+        if tick_budget_ms is not None:
+            if tick_budget_ms <= 0:
+                raise ValueError("tick_budget_ms must be positive")
+            self.tick_budget = tick_budget_ms / 1000.0
+        if max_idle_interval_ms is not None:
+            if max_idle_interval_ms <= 0:
+                raise ValueError("max_idle_interval_ms must be positive")
+            self.max_idle_interval = max(
+                self.idle_interval, max_idle_interval_ms / 1000.0
+            )
+        if max_queue_depth is not None:
+            if max_queue_depth < 1:
+                raise ValueError("max_queue_depth must be at least 1")
+            self.scheduler.max_depth = int(max_queue_depth)
+        if max_connections is not None:
+            if max_connections < 1:
+                raise ValueError("max_connections must be at least 1")
+            self.max_connections = int(max_connections)
+        return {
+            "success": True,
+            "tick_budget_ms": self.tick_budget * 1000.0,
+            "max_idle_interval_ms": self.max_idle_interval * 1000.0,
+            "max_queue_depth": self.scheduler.max_depth,
+            "max_connections": self.max_connections,
+            "message": f"Scheduler tick budget set to {self.tick_budget * 1000.0:g} ms, idle polling up to {self.max_idle_interval * 1000.0:g} ms.",
+        }
@@ -0,0 +1,119 @@
+import bpy
+from ..utils import get_object
+from ..registry import tool
+
+MAX_SPATIAL_RESULTS = 1000
+
+
+def _vector(value, label):
+    if value is None or len(value) != 3:
+        raise ValueError(f"{label} must be [x, y, z]")
+    return [float(v) for v in value]
+
+
+def _clamp_limit(limit):
+    return max(1, min(int(limit), MAX_SPATIAL_RESULTS))
+
+
+class SpatialTools:
+    def _spatial_scope(self, type=None, exclude=None):
+        """Check for names a spatial query may return: current scene, by type"""
+        types = None
+        if type:
+            types = {t.upper() for t in ([type] if isinstance(type, str) else type)}
+        accept = self.scene_index.member_test(bpy.context.scene.name, types)
+        if exclude is None:
+            return accept
+        return lambda name: name != exclude and accept(name)
+
+    def _query_origin(self, point, object_name):
+        """A query point, given directly or as an object's world location"""
+        if object_name:
+            return list(get_object(object_name).matrix_world.translation)
+        return _vector(point, "point")
+
+    @tool(read_only=True)
+    def get_objects_in_radius(
+        self, radius, center=None, object_name=None, type=None, limit=100
+    ):
+        """Objects whose world bounding box comes within a radius, nearest first"""
+        origin = self._query_origin(center, object_name)
+        accept = self._spatial_scope(type, exclude=object_name)
+        hits = [
+            (name, distance)
+            for name, distance in self.scene_index.in_radius(origin, radius)
+            if accept(name)
+        ]
+        page = hits[: _clamp_limit(limit)]
+        return {
+            "success": True,
+            "center": origin,
+            "matched": len(hits),
+            "objects": [
+                {"name": name, "distance": round(distance, 4)}
+                for name, distance in page
+            ],
+            "message": f"Found {len(hits)} object(s) within {radius} of {origin}; returned {len(page)}.",
+        }
+
+    @tool(read_only=True)
+    def get_objects_in_box(self, box, type=None, limit=100):
+        """Objects whose world bounding box overlaps an axis-aligned box"""
+        low = _vector(box.get("min"), "box.min")
+        high = _vector(box.get("max"), "box.max")
+        accept = self._spatial_scope(type)
+        names = sorted(
+            name for name in self.scene_index.in_box(low, high) if accept(name)
+        )
+        page = names[: _clamp_limit(limit)]
+        return {
+            "success": True,
+            "matched": len(names),
+            "objects": page,
+            "message": f"Found {len(names)} object(s) overlapping {low} - {high}; returned {len(page)}.",
+        }
+
+    @tool(read_only=True)
+    def get_nearest_objects(self, point=None, object_name=None, k=5, type=None):
+        """The k objects whose world bounding boxes are closest to a point"""
+        origin = self._query_origin(point, object_name)
+        accept = self._spatial_scope(type, exclude=object_name)
+        hits = self.scene_index.nearest(origin, _clamp_limit(k), accept=accept)
+        return {
+            "success": True,
+            "point": origin,
+            "objects": [
+                {"name": name, "distance": round(distance, 4)}
+                for name, distance in hits
+            ],
+            "message": f"Found the {len(hits)} nearest object(s) to {origin}",
+        }
+
+    @tool(read_only=True)
+    def get_overlapping_objects(
+        self, name=None, collection=None, type=None, tolerance=0.001, limit=100
+    ):
+        """Pairs of objects whose world bounding boxes interpenetrate"""
+        index = self.scene_index
+        accept = self._spatial_scope(type)
+        names = None  # Every object in the grid
+        if collection:
+            coll = bpy.data.collections.get(collection)
+            if not coll:
+                raise ValueError(f"Collection '{collection}' not found")
+            names = index.in_collection(coll)
+        if name:
+            matches = set(index.glob(name))
+            names = matches if names is None else names & matches
+        pairs = [
+            pair
+            for pair in index.overlapping_pairs(names, tolerance)
+            if accept(pair[0]) and accept(pair[1])
+        ]
+        page = pairs[: _clamp_limit(limit)]
+        return {
+            "success": True,
+            "matched": len(pairs),
+            "pairs": [list(pair) for pair in page],
+            "message": f"Found {len(pairs)} overlapping pair(s); returned {len(page)}.",
+        }
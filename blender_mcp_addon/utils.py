@@ -1,4 +1,5 @@
 import bpy
+from mathutils import Vector
 
 
 def hex_to_rgb(hex_color):
@@ -24,3 +25,13 @@ def get_collection(name):
         coll = bpy.data.collections.new(name)
         bpy.context.scene.collection.children.link(coll)
     return coll
+
+
+def world_bbox(obj):
+    """Axis-aligned world-space bounding box of an object as (min, max) lists"""
+    matrix = obj.matrix_world
+    corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+    return (
+        [min(c[i] for c in corners) for i in range(3)],
+        [max(c[i] for c in corners) for i in range(3)],
+    )
@@ -1,10 +1,13 @@
 import os
+import asyncio
 import socket
-import json
+import time
 import logging
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from .protocol import write_frame, read_frame
+
 load_dotenv()
 
 
@@ -12,56 +15,257 @@ load_dotenv()
 class Config:
     blender_host: str = os.getenv("BLENDER_MCP_HOST", "127.0.0.1")
     blender_port: int = int(os.getenv("BLENDER_MCP_PORT", "8888"))
+    # Pipelined connections opened while every open one has calls in flight
+    pool_size: int = int(os.getenv("BLENDER_MCP_POOL_SIZE", "4"))
+    pool_idle_timeout: float = float(os.getenv("BLENDER_MCP_POOL_IDLE_TIMEOUT", "60"))
+    # Extended timeout for heavy assets (HDRIs); also the default per-call timeout
+    socket_timeout: float = float(os.getenv("BLENDER_MCP_TIMEOUT", "120"))
+    # Calls beyond this many in flight are rejected before reaching Blender
+    max_in_flight: int = int(os.getenv("BLENDER_MCP_MAX_IN_FLIGHT", "64"))
 
 
 config = Config()
 logger = logging.getLogger("mcp_server")
 
+# Fields of the addon's cancel acknowledgement passed back to the caller
+CANCEL_FIELDS = ("cancelled", "will_finish_late", "finished")
 
-class BlenderConnection:
-    """Handles socket communication with the Blender addon"""
 
-    def recv_all(self, sock):
-        """Helper to receive all data from professional socket connection"""
-        data = b""
-        while True:
-            try:
-                chunk = sock.recv(4096)
-                if not chunk:  # Connection closed by server
-                    break
-                data += chunk
-            except socket.timeout:
-                # If we have data, we might be done, but ideally we rely on close
-                if data:
-                    break
-                continue
-            except Exception:
-                break
-        return data
+class AsyncBlenderConnection:
+    """asyncio client that pipelines many commands over one addon connection.
 
-    def send_command(self, command_type, params=None, rid="unknown"):
-        """Sends a JSON-RPC style command to Blender via TCP socket"""
-        clean_params = params if params else {}
+    Requests are written as soon as they are issued and responses are matched
+    back to their callers by `request_id`, so a cheap query is not stuck behind
+    a slow boolean or render on the same socket.
+    """
 
+    def __init__(self, host=None, port=None, timeout=None, max_in_flight=None):
+        self.host = host or config.blender_host
+        self.port = port or config.blender_port
+        self.timeout = timeout or config.socket_timeout
+        self.max_in_flight = max_in_flight or config.max_in_flight
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._pending = {}  # request_id -> Future
+        self._connect_lock = None
+        self.last_used = time.monotonic()
+
+    @property
+    def connected(self):
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def _ensure_connected(self):
+        # Created lazily so the lock binds to the running event loop
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.connected:
+                return
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            sock = writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._reader, self._writer = reader, writer
+            self._reader_task = asyncio.create_task(self._read_loop(reader, writer))
+
+    async def _read_loop(self, reader, writer):
+        """Dispatch responses to waiting callers until the connection drops"""
+        error = ConnectionError("Connection to Blender closed")
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(120.0)  # Extended timeout for heavy assets (HDRIs)
-            sock.connect((config.blender_host, config.blender_port))
+            while True:
+                response = await read_frame(reader)
+                if response is None:
+                    break
+                rid = response.get("request_id") if isinstance(response, dict) else None
+                future = self._pending.pop(rid, None)
+                if future is None:
+                    logger.warning(f"Dropping unmatched Blender response [{rid}]")
+                elif not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            error = e
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._reader = self._writer = None
+            # Everything still in flight on this connection is lost
+            for future in list(self._pending.values()):
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
 
-            payload = {"type": command_type, "params": clean_params, "request_id": rid}
-            sock.sendall(json.dumps(payload).encode("utf-8"))
+    def _wire_id(self, rid):
+        """Keep request ids unique among in-flight commands"""
+        wire_id, n = rid, 1
+        while wire_id in self._pending:
+            wire_id = f"{rid}.{n}"
+            n += 1
+        return wire_id
+
+    async def send_command(
+        self, command_type, params=None, rid="unknown", timeout=None
+    ):
+        """Sends a command to Blender without blocking the event loop"""
+        clean_params = params if params else {}
+        timeout = timeout or self.timeout
+        wire_id = None
 
-            response_data = self.recv_all(sock)
-            if not response_data:
-                return {"status": "error", "message": "No response from Blender"}
+        if len(self._pending) >= self.max_in_flight:
+            return {
+                "status": "error",
+                "code": "OVERLOADED",
+                "retry_after": 1.0,
+                "message": f"Bridge has {len(self._pending)} calls in flight to Blender. Retry after 1.0s.",
+            }
 
-            return json.loads(response_data.decode("utf-8"))
+        try:
+            await self._ensure_connected()
+            wire_id = self._wire_id(rid)
+            future = asyncio.get_running_loop().create_future()
+            self._pending[wire_id] = future
+            payload = {
+                "type": command_type,
+                "params": clean_params,
+                "request_id": wire_id,
+                # The addon drops the command once nobody is waiting for it
+                "timeout": timeout,
+            }
+            await write_frame(self._writer, payload)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Blender Connection Timeout: {command_type} after {timeout}s")
+            self._pending.pop(wire_id, None)
+            outcome = await self._cancel(wire_id)
+            return {
+                "status": "error",
+                "code": "TIMEOUT",
+                "message": f"Blender did not respond within {timeout:g}s",
+                **outcome,
+            }
+        except asyncio.CancelledError:
+            # The MCP client went away: stop Blender from running the command
+            if wire_id is not None and self.connected:
+                asyncio.ensure_future(self._cancel(wire_id))
+            raise
         except Exception as e:
             logger.error(f"Blender Connection Error: {e}")
             return {"status": "error", "message": str(e)}
         finally:
-            if "sock" in locals():
-                sock.close()
+            # A late response for an abandoned call is dropped by the read loop
+            if wire_id is not None:
+                self._pending.pop(wire_id, None)
+            self.last_used = time.monotonic()
+
+    async def _cancel(self, wire_id, wait=1.0):
+        """Ask the addon to drop a command; returns what became of it"""
+        if wire_id is None or not self.connected:
+            return {}
+        cancel_id = self._wire_id(f"{wire_id}!cancel")
+        future = asyncio.get_running_loop().create_future()
+        self._pending[cancel_id] = future
+        try:
+            await write_frame(
+                self._writer,
+                {
+                    "type": "__cancel__",
+                    "params": {"request_id": wire_id},
+                    "request_id": cancel_id,
+                },
+            )
+            ack = await asyncio.wait_for(future, wait)
+            return {k: v for k, v in ack.items() if k in CANCEL_FIELDS}
+        except Exception:
+            return {}
+        finally:
+            self._pending.pop(cancel_id, None)
+
+    def close(self):
+        """Drop the socket; the read loop fails anything still in flight"""
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+
+class ConnectionPool:
+    """A few pipelined connections to the addon, closed again when idle.
+
+    Each call goes to the connection with the fewest calls in flight. A new
+    connection is opened only while every open one is busy and the pool is
+    below its size, so a slow command's socket does not delay unrelated reads.
+    """
+
+    def __init__(
+        self,
+        host=None,
+        port=None,
+        size=None,
+        idle_timeout=None,
+        timeout=None,
+        max_in_flight=None,
+    ):
+        self.host = host or config.blender_host
+        self.port = port or config.blender_port
+        self.size = max(1, size or config.pool_size)
+        self.idle_timeout = idle_timeout or config.pool_idle_timeout
+        self.timeout = timeout or config.socket_timeout
+        self.max_in_flight = max_in_flight or config.max_in_flight
+        self._load = {}  # AsyncBlenderConnection -> calls in flight
+        self._evict_handle = None
+
+    @property
+    def in_flight(self):
+        return sum(self._load.values())
+
+    def _pick(self):
+        if self._load:
+            connection = min(self._load, key=self._load.get)
+            if self._load[connection] == 0 or len(self._load) >= self.size:
+                return connection
+        connection = AsyncBlenderConnection(
+            self.host, self.port, self.timeout, self.max_in_flight
+        )
+        self._load[connection] = 0
+        return connection
+
+    async def send_command(
+        self, command_type, params=None, rid="unknown", timeout=None
+    ):
+        """Sends a command over the least busy pooled connection"""
+        if self.in_flight >= self.max_in_flight:
+            return {
+                "status": "error",
+                "code": "OVERLOADED",
+                "retry_after": 1.0,
+                "message": f"Bridge has {self.in_flight} calls in flight to Blender. Retry after 1.0s.",
+            }
+        connection = self._pick()
+        self._load[connection] += 1
+        try:
+            return await connection.send_command(command_type, params, rid, timeout)
+        finally:
+            self._load[connection] -= 1
+            self._schedule_eviction()
+
+    def _schedule_eviction(self):
+        if self._evict_handle is not None:
+            self._evict_handle.cancel()
+        self._evict_handle = asyncio.get_running_loop().call_later(
+            self.idle_timeout, self.evict_idle
+        )
+
+    def evict_idle(self):
+        """Close connections with nothing in flight for the idle timeout"""
+        now = time.monotonic()
+        for connection, load in list(self._load.items()):
+            if load == 0 and now - connection.last_used >= self.idle_timeout:
+                connection.close()
+                del self._load[connection]
+
+    def close_all(self):
+        for connection in self._load:
+            connection.close()
+        self._load.clear()
 
 
-blender = BlenderConnection()
+async_blender = ConnectionPool()
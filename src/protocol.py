@@ -0,0 +1,92 @@
+"""
+Wire protocol between the MCP Bridge and the Blender addon.
+
+Every message is a 4-byte big-endian length header followed by a UTF-8 JSON
+payload, so a single socket can carry many request/response pairs.
+Keep in sync with blender_mcp_addon/protocol.py.
+"""
+
+import asyncio
+import json
+import struct
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+SMALL_FRAME_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Raised when the peer sends a malformed or oversized frame"""
+
+
+def send_frame(sock, message):
+    """Send one message as a framed payload"""
+    payload = json.dumps(message).encode("utf-8")
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+    header = HEADER.pack(len(payload))
+    if len(payload) <= SMALL_FRAME_SIZE:
+        # Keep small frames in one segment
+        sock.sendall(header + payload)
+    else:
+        # Avoid copying large payloads just to prepend the header
+        sock.sendall(header)
+        sock.sendall(memoryview(payload))
+
+
+def _recv_into(sock, buf):
+    """Fill `buf` completely. Returns False if the peer closed before any byte."""
+    view = memoryview(buf)
+    received = 0
+    while received < len(buf):
+        count = sock.recv_into(view[received:], min(len(buf) - received, CHUNK_SIZE))
+        if not count:
+            if received == 0:
+                return False
+            raise ProtocolError("Connection closed mid-frame")
+        received += count
+    return True
+
+
+def recv_frame(sock):
+    """Receive one framed message. Returns None on a clean end of stream."""
+    header = bytearray(HEADER.size)
+    if not _recv_into(sock, header):
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+    # Preallocate the payload and read straight into it
+    payload = bytearray(length)
+    if length and not _recv_into(sock, payload):
+        raise ProtocolError("Connection closed mid-frame")
+    return json.loads(payload)
+
+
+async def write_frame(writer, message):
+    """asyncio variant of send_frame for a StreamWriter"""
+    payload = json.dumps(message).encode("utf-8")
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+    writer.write(HEADER.pack(len(payload)))
+    writer.write(payload)
+    await writer.drain()
+
+
+async def read_frame(reader):
+    """asyncio variant of recv_frame for a StreamReader"""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise ProtocolError("Connection closed mid-frame")
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        raise ProtocolError("Connection closed mid-frame")
+    return json.loads(payload)
@@ -0,0 +1,59 @@
+"""
+Formatting of tool results returned to the agent.
+
+"verbose" keeps the addon's full result and prose message, pretty-printed.
+"compact" sends minimal JSON: an "ok" flag instead of status/success, no
+success prose, and no indentation. orjson is used when it is installed.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+RESPONSE_MODES = ("verbose", "compact")
+
+# "[AB12CD] " / "✓ [AB12CD] " prefixes the addon adds to messages
+_RID_PREFIX = re.compile(r"^(✓ )?\[[^\]]*\] ")
+
+
+def is_ok(result: dict) -> bool:
+    return (
+        result.get("status") != "error"
+        and result.get("success") is not False
+        and "error" not in result
+    )
+
+
+def compact(result: dict) -> dict:
+    """Terse form of a tool result: data fields plus error details only"""
+    ok = is_ok(result)
+    out = {"ok": ok}
+    for key, value in result.items():
+        if key in ("status", "success"):
+            continue
+        if key == "message":
+            if ok:
+                continue
+            value = _RID_PREFIX.sub("", value) if isinstance(value, str) else value
+        out[key] = value
+    return out
+
+
+def _dumps_compact(payload) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: fall back to the stdlib
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def render(result, mode: str = "verbose") -> str:
+    """Serialize a tool result for the agent in the given response mode"""
+    if mode == "compact":
+        return _dumps_compact(compact(result) if isinstance(result, dict) else result)
+    return json.dumps(result, indent=2)
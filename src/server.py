@@ -1,10 +1,11 @@
-import json
+import asyncio
 import random
 import string
 import os
 import logging
 import contextvars
 from typing import Optional
+from urllib.parse import parse_qs
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
@@ -12,14 +13,21 @@ from mcp.server import Server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 import mcp.types as types
 
-from .connection import blender, logger
-from .tools import get_mcp_tools
+from .connection import async_blender, logger
+from .tools import (
+    compare_tool_catalog,
+    get_mcp_tools,
+    get_tool_catalog,
+    get_validator,
+    parse_categories,
+)
 from .sessions import SessionRecorder
+from .responses import RESPONSE_MODES, render
 
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route, Mount
 
 load_dotenv()
@@ -29,6 +37,10 @@ recorder: Optional[SessionRecorder] = None
 
 # Transport tracking
 transport_var = contextvars.ContextVar("transport", default="MCP")
+# Optional tool category filter for list_tools, e.g. /mcp?category=modeling,scene
+category_var = contextvars.ContextVar("category", default=None)
+# Response mode for the connection, e.g. /mcp?response=compact
+response_var = contextvars.ContextVar("response", default=None)
 
 # Suppress noise from SDK and Starlette
 logging.getLogger("mcp").setLevel(logging.WARNING)
@@ -38,6 +50,8 @@ logging.getLogger("starlette").setLevel(logging.WARNING)
 app = Server("blender-mcp-n8n")
 
 ASSETS_DIR = os.getenv("BLENDER_ASSETS_DIR")
+# Default response mode: "verbose" (pretty JSON with messages) or "compact"
+RESPONSE_MODE = os.getenv("BLENDER_MCP_RESPONSE_MODE", "verbose")
 
 
 def resolve_path(args):
@@ -83,7 +97,7 @@ def resolve_path(args):
 @app.list_tools()
 async def list_tools() -> list[types.Tool]:
     """Expose available Blender tools to the AI Agent"""
-    return get_mcp_tools()
+    return get_mcp_tools(parse_categories(category_var.get()))
 
 
 @app.call_tool()
@@ -96,15 +110,32 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     meta = {"sessionId", "action", "chatInput", "toolCallId", "id"}
     clean_args = {k: v for k, v in arguments.items() if k not in meta}
 
+    # Per-call response mode overrides the connection and server defaults
+    mode = clean_args.pop("response_format", None) or response_var.get()
+    if mode not in RESPONSE_MODES:
+        mode = RESPONSE_MODE
+
     # Resolve paths
     clean_args = resolve_path(clean_args)
 
     logger.info(f"[{transport}] [{rid}] Tool Call: {name} with params: {clean_args}")
 
+    # Reject bad arguments here instead of after a trip to Blender's main thread
+    errors = get_validator().validate(name, clean_args)
+    if errors:
+        logger.info(f"[{transport}] [{rid}] [INVALID] {'; '.join(errors)}")
+        res = {
+            "status": "error",
+            "code": "INVALID_ARGUMENTS",
+            "errors": errors,
+            "message": f"Invalid arguments for {name}: {'; '.join(errors)}",
+        }
+        return [types.TextContent(type="text", text=render(res, mode))]
+
     if recorder:
         recorder.record_command(name, clean_args)
 
-    blender_res = blender.send_command(name, clean_args, rid)
+    blender_res = await async_blender.send_command(name, clean_args, rid)
 
     # Flatten nested results from bridge
     if (
@@ -137,7 +168,7 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
 
     logger.info(f"[{transport}] [{rid}] [{log_status}] {log_msg}")
 
-    return [types.TextContent(type="text", text=json.dumps(blender_res, indent=2))]
+    return [types.TextContent(type="text", text=render(blender_res, mode))]
 
 
 # MCP Application Logic (Streamable Transport)
@@ -147,13 +178,33 @@ session_manager = StreamableHTTPSessionManager(
 )
 
 
+async def check_tool_catalog():
+    """Warn when the addon's handlers and the advertised tool schemas drift apart"""
+    res = await async_blender.send_command("get_tool_manifest", {}, "startup", 10.0)
+    if res.get("status") != "success":
+        logger.info(
+            f"Tool catalog check skipped: {res.get('message', 'Blender not reachable')}"
+        )
+        return
+    drift = compare_tool_catalog(res["result"]["tools"])
+    for name in drift["missing_handlers"]:
+        logger.warning(f"Tool '{name}' is advertised but Blender has no handler for it")
+    for name in drift["missing_schemas"]:
+        logger.warning(f"Blender handles '{name}' but no tool schema advertises it")
+    if not any(drift.values()):
+        logger.info(f"Tool catalog check passed ({len(get_mcp_tools())} tools)")
+
+
 @asynccontextmanager
 async def lifespan(app: Starlette):
     """Manage the lifecycle of the MCP session manager"""
     # print("[DEBUG] Starlette lifespan starting...")
+    get_validator()  # Build the tool catalog and validators before the first request
+    catalog_check = asyncio.create_task(check_tool_catalog())
     async with session_manager.run():
         # print("[DEBUG] MCP Session Manager active.")
         yield
+    catalog_check.cancel()
     # print("[DEBUG] Starlette lifespan shutting down...")
 
 
@@ -195,10 +246,29 @@ async def mcp_asgi(scope, receive, send):
             res = "Stateful" if (is_stateful_heuristic or not is_root) else "Stateless"
 
         transport_var.set(res)
+        params = parse_qs(query)
+        category_var.set(params.get("category", [None])[0])
+        header_mode = next(
+            (h[1].decode() for h in headers if h[0] == b"x-mcp-response"), None
+        )
+        response_var.set(params.get("response", [header_mode])[0])
 
     await session_manager.handle_request(scope, receive, send)
 
 
+async def tools_catalog(request):
+    """Serve the prebuilt tool list as JSON, with an ETag for cheap re-checks"""
+    try:
+        categories = parse_categories(request.query_params.get("category"))
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    body, etag = get_tool_catalog(categories)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 async def root_redirect(request):
     return Response(
         "Blender MCP Server is running. Access /editor/ for the Session Editor.",
@@ -210,6 +280,7 @@ async def root_redirect(request):
 starlette_app = Starlette(
     routes=[
         Route("/", root_redirect),
+        Route("/tools", tools_catalog),
         Mount("/mcp", app=mcp_asgi),
         Mount(
             "/editor", StaticFiles(directory="session_editor", html=True), name="editor"
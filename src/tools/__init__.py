@@ -1,4 +1,9 @@
+import hashlib
+import json
+
 from mcp import types
+from ..responses import RESPONSE_MODES
+from ..validation import ArgumentValidator
 from .modeling import get_modeling_tools
 from .scene import get_scene_tools
 from .collections import get_collection_tools
@@ -8,18 +13,105 @@ from .camera import get_camera_tools
 from .animation import get_animation_tools
 from .rendering import get_rendering_tools
 from .history import get_history_tools
+from .batch import get_batch_tools
+from .spatial import get_spatial_tools
+
+# Tool groups agents can ask for on their own, in catalog order
+TOOL_CATEGORIES = {
+    "scene": get_scene_tools,
+    "spatial": get_spatial_tools,
+    "collections": get_collection_tools,
+    "modeling": get_modeling_tools,
+    "materials": get_material_tools,
+    "lighting": get_lighting_tools,
+    "camera": get_camera_tools,
+    "animation": get_animation_tools,
+    "rendering": get_rendering_tools,
+    "history": get_history_tools,
+    "batch": get_batch_tools,
+}
+
+# Per-call option every tool accepts; the Bridge strips it before forwarding
+RESPONSE_FORMAT_SCHEMA = {
+    "type": "string",
+    "enum": list(RESPONSE_MODES),
+    "description": "Result format for this call: verbose JSON with messages, or compact",
+}
+
+_by_category: dict[str, list[types.Tool]] = {}
+_views: dict[tuple, list[types.Tool]] = {}
+_serialized: dict[tuple, tuple[bytes, str]] = {}
+_validator: list[ArgumentValidator] = []
+
+
+def parse_categories(value: str | None) -> tuple[str, ...] | None:
+    """Turn 'modeling,scene' into a validated category filter (None = all)"""
+    if not value:
+        return None
+    categories = tuple(
+        sorted({name.strip().lower() for name in value.split(",") if name.strip()})
+    )
+    unknown = [name for name in categories if name not in TOOL_CATEGORIES]
+    if unknown:
+        raise ValueError(
+            f"Unknown tool category {', '.join(unknown)}. Use: {', '.join(TOOL_CATEGORIES)}"
+        )
+    return categories or None
+
+
+def get_mcp_tools(categories: tuple[str, ...] | None = None) -> list[types.Tool]:
+    """Returns Blender tools from all modules, or only the given categories.
+
+    Tool objects are built once per process and every view is cached.
+    """
+    if not _by_category:
+        for name, build in TOOL_CATEGORIES.items():
+            tools = build()
+            for tool in tools:
+                properties = tool.inputSchema.setdefault("properties", {})
+                properties.setdefault("response_format", RESPONSE_FORMAT_SCHEMA)
+            _by_category[name] = tools
+    key = categories or ()
+    if key not in _views:
+        _views[key] = [
+            tool
+            for name, tools in _by_category.items()
+            if not categories or name in categories
+            for tool in tools
+        ]
+    return _views[key]
+
+
+def get_tool_catalog(
+    categories: tuple[str, ...] | None = None,
+) -> tuple[bytes, str]:
+    """The serialized tool list and its ETag, computed once per view"""
+    key = categories or ()
+    if key not in _serialized:
+        tools = [
+            tool.model_dump(mode="json", exclude_none=True)
+            for tool in get_mcp_tools(categories)
+        ]
+        body = json.dumps({"tools": tools}, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        _serialized[key] = (body, etag)
+    return _serialized[key]
+
+
+def get_validator() -> ArgumentValidator:
+    """Argument validators for every tool, compiled once per process"""
+    if not _validator:
+        _validator.append(
+            ArgumentValidator({tool.name: tool.inputSchema for tool in get_mcp_tools()})
+        )
+    return _validator[0]
 
 
-def get_mcp_tools() -> list[types.Tool]:
-    """Returns all Blender tools from all modules"""
-    tools = []
-    tools.extend(get_scene_tools())
-    tools.extend(get_collection_tools())
-    tools.extend(get_modeling_tools())
-    tools.extend(get_material_tools())
-    tools.extend(get_lighting_tools())
-    tools.extend(get_camera_tools())
-    tools.extend(get_animation_tools())
-    tools.extend(get_rendering_tools())
-    tools.extend(get_history_tools())
-    return tools
+def compare_tool_catalog(manifest: list[dict]) -> dict:
+    """Compare the addon's registered handlers with the advertised schemas"""
+    advertised = {tool.name for tool in get_mcp_tools()}
+    handled = {entry["name"] for entry in manifest if not entry.get("internal")}
+    return {
+        "missing_handlers": sorted(advertised - handled),
+        "missing_schemas": sorted(handled - advertised),
+    }
@@ -0,0 +1,36 @@
+from mcp import types
+
+
+def get_batch_tools() -> list[types.Tool]:
+    return [
+        types.Tool(
+            name="execute_batch",
+            description="Run an ordered list of tool calls in one round trip and one undo step. Returns a result per entry.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "commands": {
+                        "type": "array",
+                        "description": "Tool calls to run in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "tool": {"type": "string"},
+                                "arguments": {"type": "object"},
+                            },
+                            "required": ["tool"],
+                        },
+                    },
+                    "stop_on_error": {
+                        "type": "boolean",
+                        "description": "Stop at the first failing entry (default true) or continue",
+                    },
+                    "transactional": {
+                        "type": "boolean",
+                        "description": "Roll back every change the batch made if any entry fails (default false)",
+                    },
+                },
+                "required": ["commands"],
+            },
+        ),
+    ]
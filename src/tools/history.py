@@ -13,4 +13,30 @@ def get_history_tools() -> list[types.Tool]:
             description="Redo the last undone action in Blender",
             inputSchema={"type": "object", "properties": {}},
         ),
+        types.Tool(
+            name="configure_undo",
+            description="Choose how often MCP commands push undo steps and cap undo memory. Undo memory in use is reported by get_debug_info.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "policy": {
+                        "type": "string",
+                        "enum": ["command", "batch", "every_n", "off"],
+                        "description": "command: one step per command (default); batch: one step per burst of queued commands; every_n: one step every N commands; off: no steps, for bulk generation",
+                    },
+                    "every_n": {
+                        "type": "integer",
+                        "description": "Commands per undo step for the every_n policy (default 10)",
+                    },
+                    "memory_limit_mb": {
+                        "type": "integer",
+                        "description": "Blender undo memory limit in MB (0 = unlimited)",
+                    },
+                    "max_steps": {
+                        "type": "integer",
+                        "description": "Maximum number of undo steps Blender keeps",
+                    },
+                },
+            },
+        ),
     ]
@@ -32,6 +32,35 @@ def get_lighting_tools() -> list[types.Tool]:
                 "required": ["name", "type", "location"],
             },
         ),
+        types.Tool(
+            name="configure_light",
+            description="Update an existing light's energy, color, rotation, angle or size",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "light_name": {"type": "string"},
+                    "energy": {"type": "number"},
+                    "color": {
+                        "type": "string",
+                        "description": "Hex color string (e.g., '#FF9900')",
+                    },
+                    "rotation": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Rotation in degrees [x, y, z]",
+                    },
+                    "angle": {
+                        "type": "number",
+                        "description": "For SUN: angular diameter in degrees",
+                    },
+                    "size": {
+                        "type": "number",
+                        "description": "For AREA: size of the light",
+                    },
+                },
+                "required": ["light_name"],
+            },
+        ),
         types.Tool(
             name="set_world_background",
             description="Set the world background to a solid color, a procedural sky, or an HDRI environment image.",
@@ -5,6 +5,7 @@ from .transforms import get_transform_tools
 from .selection import get_selection_tools
 from .operators import get_operator_tools
 from .architectural import get_architectural_tools
+from .export import get_export_tools
 
 
 def get_modeling_tools() -> list[types.Tool]:
@@ -16,4 +17,5 @@ def get_modeling_tools() -> list[types.Tool]:
     tools.extend(get_selection_tools())
     tools.extend(get_operator_tools())
     tools.extend(get_architectural_tools())
+    tools.extend(get_export_tools())
     return tools
@@ -0,0 +1,48 @@
+from mcp import types
+
+
+def get_export_tools() -> list[types.Tool]:
+    return [
+        types.Tool(
+            name="export_mesh_data",
+            description="Export a mesh's geometry for downstream processing (area takeoffs, clash checks). Returns vertices, polygon sizes, polygon vertex indices and normals as base64 little-endian buffers with their dtype and shape, split into chunks for large meshes, or writes them all to an .npz file.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Object name"},
+                    "evaluated": {
+                        "type": "boolean",
+                        "description": "Export the geometry after modifiers (default false). Also converts curves and text to a mesh.",
+                    },
+                    "world_space": {
+                        "type": "boolean",
+                        "description": "Transform vertices and normals by matrix_world (default false; matrix_world is always returned)",
+                    },
+                    "normals": {
+                        "type": "boolean",
+                        "description": "Include vertex and polygon normals (default true)",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Write every buffer to this .npz file instead of returning them",
+                    },
+                    "encoding": {
+                        "type": "string",
+                        "enum": ["base64", "list"],
+                        "description": "base64 binary (default) or plain JSON lists",
+                    },
+                    "chunk": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Chunk to return; pass next_chunk back until it is null",
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Vertices and polygons per chunk (default 250000)",
+                    },
+                },
+                "required": ["name"],
+            },
+        ),
+    ]
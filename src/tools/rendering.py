@@ -21,24 +21,73 @@ def get_rendering_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="render_frame",
-            description="Render the current frame.",
+            description="Render the current frame. Set as_job=true to return a job id immediately instead of waiting.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "output_path": {"type": "string"},
+                    "as_job": {
+                        "type": "boolean",
+                        "description": "Run as a background job and return its job_id",
+                    },
                 },
             },
         ),
         types.Tool(
             name="render_animation",
-            description="Render an animation sequence.",
+            description="Render an animation sequence. Set as_job=true to render frame by frame in the background and poll with get_job_status.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "start_frame": {"type": "integer"},
                     "end_frame": {"type": "integer"},
                     "output_dir": {"type": "string"},
+                    "as_job": {
+                        "type": "boolean",
+                        "description": "Run as a background job and return its job_id",
+                    },
+                    "workers": {
+                        "type": "integer",
+                        "description": "Render in this many headless Blender processes (runs as a job)",
+                    },
+                    "engine": {
+                        "type": "string",
+                        "enum": ["CYCLES", "BLENDER_WORKBENCH"],
+                        "description": "CPU engine for headless workers (defaults to the scene engine)",
+                    },
+                },
+            },
+        ),
+        types.Tool(
+            name="get_job_status",
+            description="Get state and per-frame progress of a render job. Omit job_id to list all jobs.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"},
+                },
+            },
+        ),
+        types.Tool(
+            name="get_job_output",
+            description="Get the output files a render job has produced so far.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"},
+                },
+                "required": ["job_id"],
+            },
+        ),
+        types.Tool(
+            name="cancel_job",
+            description="Cancel a render job after its current frame.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"},
                 },
+                "required": ["job_id"],
             },
         ),
     ]
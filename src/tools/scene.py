@@ -5,8 +5,70 @@ def get_scene_tools() -> list[types.Tool]:
     return [
         types.Tool(
             name="get_scene_info",
-            description="Get information about the current Blender scene",
-            inputSchema={"type": "object", "properties": {}},
+            description="Get information about the current Blender scene. Objects are returned in pages sorted by name: pass next_cursor back as cursor to continue. Filter by type, collection, name glob or region, and pick fields to keep pages small.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Objects per page (default 100, max 1000)",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page",
+                    },
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                    "collection": {
+                        "type": "string",
+                        "description": "Only objects in this collection or its children",
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Name glob, e.g. 'Wall_*'",
+                    },
+                    "region": {
+                        "type": "object",
+                        "description": "Only objects whose world bounding box overlaps this box",
+                        "properties": {
+                            "min": {"type": "array", "items": {"type": "number"}},
+                            "max": {"type": "array", "items": {"type": "number"}},
+                        },
+                        "required": ["min", "max"],
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": [
+                                "name",
+                                "type",
+                                "location",
+                                "rotation",
+                                "scale",
+                                "dimensions",
+                                "parent",
+                                "collections",
+                                "bbox",
+                                "vertices",
+                                "faces",
+                                "modifiers",
+                                "materials",
+                            ],
+                        },
+                        "description": "Fields per object (default name, type, location)",
+                    },
+                    "stream_to": {
+                        "type": "string",
+                        "description": "Write every matching object to this file as NDJSON in a background job instead of returning a page. '//' paths are relative to the .blend file; the directory must exist",
+                    },
+                },
+            },
         ),
         types.Tool(
             name="get_object_info",
@@ -19,6 +81,120 @@ def get_scene_tools() -> list[types.Tool]:
                 "required": ["name"],
             },
         ),
+        types.Tool(
+            name="get_object_transforms",
+            description="Export location, rotation, scale, dimensions and world bounding boxes of every matching object in one call, as arrays with one row per name. Use for scene-wide layout checks; 'base64' returns little-endian float32 blobs with their shape.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                    "collection": {
+                        "type": "string",
+                        "description": "Only objects in this collection or its children",
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Name glob, e.g. 'Wall_*'",
+                    },
+                    "region": {
+                        "type": "object",
+                        "description": "Only objects whose world bounding box overlaps this box",
+                        "properties": {
+                            "min": {"type": "array", "items": {"type": "number"}},
+                            "max": {"type": "array", "items": {"type": "number"}},
+                        },
+                        "required": ["min", "max"],
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": [
+                                "location",
+                                "rotation",
+                                "scale",
+                                "dimensions",
+                                "bbox",
+                            ],
+                        },
+                        "description": "Arrays to return (default all). bbox returns bbox_min and bbox_max.",
+                    },
+                    "encoding": {
+                        "type": "string",
+                        "enum": ["list", "base64"],
+                        "description": "Nested [x, y, z] lists (default) or base64 binary",
+                    },
+                },
+            },
+        ),
+        types.Tool(
+            name="get_scene_changes",
+            description="List the objects added, removed or modified since a scene revision, to keep a mirror of the scene up to date without re-fetching it. get_scene_info and get_objects_info return the current revision; pass it as 'since' next time. If 'reset' is true, the revision is too old and the scene must be re-fetched.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "since": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Revision from a previous response (default 0)",
+                    }
+                },
+            },
+        ),
+        types.Tool(
+            name="get_objects_info",
+            description="Get information about many objects in one call, e.g. to snapshot a scene. Returns a 'names' list and one column per requested field, in the same order. Pass next_cursor back as cursor to continue.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Object names; unknown names are listed under 'missing'",
+                    },
+                    "pattern": {
+                        "type": "string",
+                        "description": "Name glob, e.g. 'Wall_*'",
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": [
+                                "name",
+                                "type",
+                                "location",
+                                "rotation",
+                                "scale",
+                                "dimensions",
+                                "parent",
+                                "collections",
+                                "bbox",
+                                "vertices",
+                                "faces",
+                                "modifiers",
+                                "materials",
+                            ],
+                        },
+                        "description": "Columns to return (default type, transform, dimensions, mesh counts and modifiers). vertices and faces are null for non-mesh objects.",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Objects per page (default and max 1000)",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page",
+                    },
+                },
+            },
+        ),
         types.Tool(
             name="get_distance",
             description="Measure the distance between two objects.",
@@ -52,4 +228,34 @@ def get_scene_tools() -> list[types.Tool]:
             description="Get diagnostic information about the server.",
             inputSchema={"type": "object", "properties": {}},
         ),
+        types.Tool(
+            name="get_tool_manifest",
+            description="List the command handlers registered in the Blender addon with their scheduling lane and whether they change the scene.",
+            inputSchema={"type": "object", "properties": {}},
+        ),
+        types.Tool(
+            name="configure_scheduler",
+            description="Tune Blender main-thread time slicing and admission limits for MCP commands.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tick_budget_ms": {
+                        "type": "number",
+                        "description": "Time budget per tick before yielding to the UI",
+                    },
+                    "max_idle_interval_ms": {
+                        "type": "number",
+                        "description": "Longest polling interval while no commands arrive (5 restores fixed polling)",
+                    },
+                    "max_queue_depth": {
+                        "type": "integer",
+                        "description": "Queued commands beyond this are rejected with a retry_after hint",
+                    },
+                    "max_connections": {
+                        "type": "integer",
+                        "description": "Maximum concurrent client connections to the addon",
+                    },
+                },
+            },
+        ),
     ]
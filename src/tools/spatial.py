@@ -0,0 +1,138 @@
+from mcp import types
+
+
+def get_spatial_tools() -> list[types.Tool]:
+    return [
+        types.Tool(
+            name="get_objects_in_radius",
+            description="Find objects whose world bounding box comes within a radius of a point or of another object, nearest first.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "radius": {"type": "number", "minimum": 0},
+                    "center": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "minItems": 3,
+                        "maxItems": 3,
+                        "description": "[x, y, z] query point",
+                    },
+                    "object_name": {
+                        "type": "string",
+                        "description": "Use this object's location as the center (the object itself is excluded)",
+                    },
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum objects returned (default 100, max 1000)",
+                    },
+                },
+                "required": ["radius"],
+            },
+        ),
+        types.Tool(
+            name="get_objects_in_box",
+            description="Find objects whose world bounding box overlaps an axis-aligned box.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "box": {
+                        "type": "object",
+                        "properties": {
+                            "min": {
+                                "type": "array",
+                                "items": {"type": "number"},
+                                "minItems": 3,
+                                "maxItems": 3,
+                            },
+                            "max": {
+                                "type": "array",
+                                "items": {"type": "number"},
+                                "minItems": 3,
+                                "maxItems": 3,
+                            },
+                        },
+                        "required": ["min", "max"],
+                    },
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum objects returned (default 100, max 1000)",
+                    },
+                },
+                "required": ["box"],
+            },
+        ),
+        types.Tool(
+            name="get_nearest_objects",
+            description="Find the k objects closest to a point or to another object, measured to their world bounding boxes.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "point": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "minItems": 3,
+                        "maxItems": 3,
+                        "description": "[x, y, z] query point",
+                    },
+                    "object_name": {
+                        "type": "string",
+                        "description": "Use this object's location as the point (the object itself is excluded)",
+                    },
+                    "k": {"type": "integer", "minimum": 1, "description": "Default 5"},
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                },
+            },
+        ),
+        types.Tool(
+            name="get_overlapping_objects",
+            description="Find pairs of objects whose world bounding boxes interpenetrate, e.g. to check a generated layout for collisions.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Only check objects matching this name glob",
+                    },
+                    "collection": {
+                        "type": "string",
+                        "description": "Only check objects in this collection",
+                    },
+                    "type": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Object type(s), e.g. MESH, LIGHT, CAMERA, EMPTY",
+                    },
+                    "tolerance": {
+                        "type": "number",
+                        "description": "Minimum penetration depth on every axis; touching boxes are not reported (default 0.001)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum pairs returned (default 100, max 1000)",
+                    },
+                },
+            },
+        ),
+    ]
@@ -0,0 +1,181 @@
+"""
+Tool argument validation, compiled once from each tool's inputSchema.
+
+Covers the JSON Schema subset the tool schemas use: type, properties,
+required, items, enum, anyOf, minimum/maximum and minItems/maxItems.
+Unknown keys are ignored rather than rejected, since some handlers take
+extra keyword arguments.
+"""
+
+from typing import Callable
+
+# Errors reported per call; enough for an agent to fix everything in one retry
+MAX_ERRORS = 10
+
+# Tool whose `commands` entries are themselves tool calls, checked one by one
+BATCH_TOOL = "execute_batch"
+
+Check = Callable[[object, str, list], None]
+
+_TYPE_NAMES = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+
+def _type_name(value) -> str:
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "number": _is_number,
+    "integer": lambda v: _is_number(v) and float(v).is_integer(),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def compile_schema(schema: dict) -> Check:
+    """Build a check(value, path, errors) function for one schema node"""
+    checks: list[Check] = []
+
+    if "anyOf" in schema:
+        options = [compile_schema(option) for option in schema["anyOf"]]
+        expected = " or ".join(option.get("type", "?") for option in schema["anyOf"])
+
+        def check_any_of(value, path, errors):
+            for option in options:
+                trial: list = []
+                option(value, path, trial)
+                if not trial:
+                    return
+            errors.append(f"{path}: expected {expected}, got {_type_name(value)}")
+
+        checks.append(check_any_of)
+
+    expected_type = schema.get("type")
+    if expected_type in _TYPE_CHECKS:
+        is_type = _TYPE_CHECKS[expected_type]
+
+        def check_type(value, path, errors):
+            if not is_type(value):
+                errors.append(
+                    f"{path}: expected {expected_type}, got {_type_name(value)}"
+                )
+                return False
+            return True
+
+    else:
+        check_type = None
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append(
+                    f"{path}: {value!r} is not one of {', '.join(map(str, allowed))}"
+                )
+
+        checks.append(check_enum)
+
+    low, high = schema.get("minimum"), schema.get("maximum")
+    if low is not None or high is not None:
+
+        def check_range(value, path, errors):
+            if low is not None and value < low:
+                errors.append(f"{path}: {value} is below the minimum {low}")
+            if high is not None and value > high:
+                errors.append(f"{path}: {value} is above the maximum {high}")
+
+        checks.append(check_range)
+
+    if expected_type == "array":
+        item_check = compile_schema(schema["items"]) if "items" in schema else None
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+
+        def check_array(value, path, errors):
+            if min_items is not None and len(value) < min_items:
+                errors.append(f"{path}: needs at least {min_items} item(s)")
+            if max_items is not None and len(value) > max_items:
+                errors.append(f"{path}: allows at most {max_items} item(s)")
+            if item_check:
+                for index, item in enumerate(value):
+                    if len(errors) >= MAX_ERRORS:
+                        return
+                    item_check(item, f"{path}[{index}]", errors)
+
+        checks.append(check_array)
+
+    if expected_type == "object":
+        properties = {
+            name: compile_schema(sub)
+            for name, sub in schema.get("properties", {}).items()
+        }
+        required = list(schema.get("required", []))
+
+        def check_object(value, path, errors):
+            prefix = f"{path}." if path else ""
+            for name in required:
+                if value.get(name) is None:
+                    errors.append(f"{prefix}{name}: required")
+            for name, prop_check in properties.items():
+                if len(errors) >= MAX_ERRORS:
+                    return
+                # Handlers treat null as "not given" for optional arguments
+                if value.get(name) is not None:
+                    prop_check(value[name], f"{prefix}{name}", errors)
+
+        checks.append(check_object)
+
+    def check(value, path, errors):
+        if check_type and not check_type(value, path, errors):
+            return
+        for step in checks:
+            step(value, path, errors)
+
+    return check
+
+
+class ArgumentValidator:
+    """Validates tool arguments against every tool's compiled inputSchema"""
+
+    def __init__(self, schemas: dict[str, dict]):
+        self._checks = {
+            name: compile_schema(schema) for name, schema in schemas.items()
+        }
+
+    def validate(self, name: str, arguments: dict) -> list[str]:
+        """Problems with the arguments, as 'path: reason' strings (empty if valid)"""
+        check = self._checks.get(name)
+        if check is None:
+            return [f"Unknown tool '{name}'"]
+        errors: list[str] = []
+        check(arguments, "", errors)
+        if name == BATCH_TOOL and not errors:
+            self._validate_batch(arguments["commands"], errors)
+        return errors[:MAX_ERRORS]
+
+    def _validate_batch(self, commands: list, errors: list) -> None:
+        """Check every batch entry against its own tool's schema"""
+        for index, entry in enumerate(commands):
+            if len(errors) >= MAX_ERRORS:
+                return
+            path = f"commands[{index}]"
+            check = self._checks.get(entry["tool"])
+            if check is None:
+                errors.append(f"{path}.tool: unknown tool '{entry['tool']}'")
+            else:
+                check(entry.get("arguments") or {}, f"{path}.arguments", errors)
@@ -15,6 +15,8 @@ from tests.scenarios.arch_layout import ArchLayoutScenario
 # Configure paths
 TESTS_DIR = Path(__file__).parent
 BENCHMARKS_DIR = TESTS_DIR / "benchmarks"
+# Objects created by the scenarios, snapshotted in detail
+TEST_PREFIXES = ("Test_", "HDB_", "Wall_", "Col_", "Lbl_", "Unit_")
 
 SCENARIOS = {
     "grid": GridLayoutScenario,
@@ -86,28 +88,28 @@ def run(host, verify, scenario, module, transport):
         print("Capturing scene state...")
         scene_info = client.call_tool("get_scene_info", {})
 
-        # Get details for created objects
+        # Get details for created objects, in one bulk call per page
         detailed_objects = {}
-        if "objects" in scene_info and isinstance(scene_info["objects"], list):
-            for obj in scene_info["objects"]:
-                name = obj.get("name")
-                if not name:
-                    continue
-
+        cursor = None
+        while True:
+            arguments = {"pattern": "*", "limit": 1000}
+            if cursor:
+                arguments["cursor"] = cursor
+            details = client.call_tool("get_objects_info", arguments)
+            columns = details.get("columns", {})
+            for i, name in enumerate(details.get("names", [])):
                 # Identify test objects
-                is_test_obj = (
-                    name.startswith("Test_")
-                    or name.startswith("HDB_")
-                    or name.startswith("Wall_")
-                    or name.startswith("Col_")
-                    or name.startswith("Lbl_")
-                    or name.startswith("Unit_")
-                    or name == "Test_Integration_Collection"
-                )
-
-                if is_test_obj:
-                    details = client.call_tool("get_object_info", {"name": name})
-                    detailed_objects[name] = details
+                if not name.startswith(TEST_PREFIXES):
+                    continue
+                row = {"name": name}
+                for field, values in columns.items():
+                    # get_object_info leaves out mesh counts for other types
+                    if values[i] is not None:
+                        row[field] = values[i]
+                detailed_objects[name] = row
+            cursor = details.get("next_cursor")
+            if not cursor:
+                break
 
         snapshot = {"scene_summary": scene_info, "detailed_objects": detailed_objects}
         BENCHMARKS_DIR.mkdir(exist_ok=True)
@@ -0,0 +1,117 @@
+import queue
+import socket
+import threading
+import time
+from src.protocol import recv_frame, send_frame
+from tests.utils.addon import load_addon_module
+
+channel = load_addon_module("channel")
+scheduler = load_addon_module("scheduler")
+
+
+class FakeServer:
+    """Collects submitted commands; the test completes them by hand"""
+
+    running = True
+
+    def __init__(self):
+        self.submitted = queue.Queue()
+
+    def submit_command(self, command, callback):
+        ticket = scheduler.CommandTicket()
+        self.submitted.put((command, callback, ticket))
+        return ticket
+
+    def next(self):
+        return self.submitted.get(timeout=5.0)
+
+
+def test_client_channel():
+    server = FakeServer()
+    left, right = socket.socketpair()
+    left.settimeout(5.0)
+    client = channel.ClientChannel(server, right)
+    serving = threading.Thread(target=client.serve, daemon=True)
+    serving.start()
+    try:
+        print("1. Answering pipelined commands in completion order...")
+        send_frame(left, {"type": "get_scene_info", "request_id": "a"})
+        send_frame(left, {"type": "get_object_info", "request_id": "b"})
+        (_, done_a, _), (_, done_b, _) = server.next(), server.next()
+        done_b({"status": "success", "value": "B"})
+        done_a({"status": "success", "value": "A"})
+        assert recv_frame(left) == {
+            "status": "success",
+            "value": "B",
+            "request_id": "b",
+        }
+        assert recv_frame(left)["request_id"] == "a"
+
+        print("2. Rejecting a request_id that is already in flight...")
+        send_frame(left, {"type": "create_cube", "request_id": "c"})
+        _, done_c, ticket_c = server.next()
+        send_frame(left, {"type": "create_cube", "request_id": "c"})
+        error = recv_frame(left)
+        assert error["request_id"] == "c" and "Duplicate" in error["message"]
+
+        print("3. Cancelling a queued command on request...")
+        cancel = {
+            "type": "__cancel__",
+            "request_id": "x",
+            "params": {"request_id": "c"},
+        }
+        send_frame(left, cancel)
+        ack = recv_frame(left)
+        assert ack["target"] == "c" and ack["cancelled"] == "before_start"
+        assert ticket_c.state == scheduler.CommandTicket.CANCELLED
+        done_c({"status": "success"})  # Already answered: must not be sent
+
+        print("4. Requiring a request_id...")
+        send_frame(left, {"type": "get_scene_info"})
+        assert "request_id" in recv_frame(left)["message"]
+
+        print("5. Timing out a command at the caller's deadline...")
+        send_frame(left, {"type": "render_frame", "request_id": "d", "timeout": 0.1})
+        _, _, ticket_d = server.next()
+        timeout = recv_frame(left)
+        assert timeout["request_id"] == "d" and timeout["code"] == "TIMEOUT"
+        assert timeout["cancelled"] == "before_start" and ticket_d.abandoned
+
+        print("6. Falling back to the channel timeout without a deadline...")
+        client.command_timeout = 0.1
+        send_frame(left, {"type": "render_frame", "request_id": "f"})
+        server.next()
+        assert recv_frame(left)["request_id"] == "f"
+        client.command_timeout = 60.0
+
+        print("7. Expiring deadlines while other responses keep flowing...")
+        send_frame(left, {"type": "render_frame", "request_id": "g", "timeout": 0.3})
+        server.next()
+        expired = None
+        for n in range(40):
+            rid = f"busy-{n}"
+            send_frame(left, {"type": "get_scene_info", "request_id": rid})
+            _, done, _ = server.next()
+            time.sleep(0.05)
+            done({"status": "success"})
+            while (response := recv_frame(left))["request_id"] != rid:
+                expired = response
+            if expired:
+                break
+        assert expired["request_id"] == "g" and expired["code"] == "TIMEOUT"
+
+        print("8. Cancelling in-flight commands when the client disconnects...")
+        send_frame(left, {"type": "create_cube", "request_id": "e"})
+        _, _, ticket_e = server.next()
+        left.close()
+        serving.join(timeout=10.0)
+        assert not serving.is_alive()
+        assert ticket_e.reason == "client disconnected"
+    finally:
+        left.close()
+        right.close()
+    print("✅ Client Channel Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_client_channel()
@@ -0,0 +1,121 @@
+import asyncio
+from src.connection import AsyncBlenderConnection, ConnectionPool
+from src.protocol import read_frame, write_frame
+
+
+async def _fake_addon(reader, writer, seen):
+    """Answers 'pair' commands two at a time in reverse order, never 'slow'"""
+    held = []
+    while (message := await read_frame(reader)) is not None:
+        seen.append(message)
+        rid = message["request_id"]
+        if message["type"] == "__cancel__":
+            target = message["params"]["request_id"]
+            await write_frame(
+                writer,
+                {"request_id": rid, "target": target, "cancelled": "before_start"},
+            )
+        elif message["type"] == "echo":
+            await write_frame(writer, {"status": "success", "request_id": rid})
+        elif message["type"] == "pair":
+            held.append(message)
+            if len(held) == 2:
+                for held_message in reversed(held):
+                    await write_frame(
+                        writer,
+                        {
+                            "status": "success",
+                            "request_id": held_message["request_id"],
+                            "echo": held_message["params"],
+                        },
+                    )
+                held.clear()
+    writer.close()
+
+
+def test_pipelined_client():
+    async def run():
+        print("1. Starting a fake addon that answers out of order...")
+        seen = []
+        server = await asyncio.start_server(
+            lambda r, w: _fake_addon(r, w, seen), "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncBlenderConnection("127.0.0.1", port, timeout=5.0)
+
+        print("2. Matching responses to callers by request_id...")
+        first, second = await asyncio.gather(
+            client.send_command("pair", {"n": 1}, rid="a"),
+            client.send_command("pair", {"n": 2}, rid="b"),
+        )
+        assert first["echo"] == {"n": 1} and first["request_id"] == "a"
+        assert seen[0]["timeout"] == 5.0  # The addon expires it at our deadline
+        assert second["echo"] == {"n": 2} and second["request_id"] == "b"
+
+        print("3. Rewriting a duplicate request_id while the first is in flight...")
+        seen.clear()
+        first, second = await asyncio.gather(
+            client.send_command("pair", {"n": 1}, rid="dup"),
+            client.send_command("pair", {"n": 2}, rid="dup"),
+        )
+        assert [m["request_id"] for m in seen] == ["dup", "dup.1"]
+        assert first["echo"] == {"n": 1} and second["echo"] == {"n": 2}
+
+        print("4. Cancelling a command in Blender when it times out...")
+        seen.clear()
+        result = await client.send_command("slow", {}, rid="s", timeout=0.2)
+        assert result["code"] == "TIMEOUT"
+        assert result["cancelled"] == "before_start"
+        assert seen[-1]["type"] == "__cancel__"
+        assert seen[-1]["params"] == {"request_id": "s"}
+        assert not client._pending
+
+        client._writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+    print("✅ Pipelined Client Unit Test Passed!")
+
+
+def test_connection_pool():
+    async def run():
+        print("1. Starting a fake addon that counts connections...")
+        accepted = []
+
+        def handle(reader, writer):
+            accepted.append(writer)
+            return _fake_addon(reader, writer, [])
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        pool = ConnectionPool("127.0.0.1", port, size=2, idle_timeout=0.2)
+
+        print("2. Opening a second connection only while the first is busy...")
+        await asyncio.gather(*(pool.send_command("echo") for _ in range(3)))
+        assert len(accepted) == 2 and len(pool._load) == 2
+
+        print("3. Reusing an idle connection for sequential calls...")
+        for _ in range(3):
+            assert (await pool.send_command("echo"))["status"] == "success"
+        assert len(accepted) == 2 and pool.in_flight == 0
+
+        print("4. Closing connections after the idle timeout...")
+        await asyncio.sleep(0.4)
+        assert not pool._load
+
+        print("5. Reconnecting on the next call...")
+        assert (await pool.send_command("echo"))["status"] == "success"
+        assert len(accepted) == 3
+
+        pool.close_all()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+    print("✅ Connection Pool Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_pipelined_client()
+    test_connection_pool()
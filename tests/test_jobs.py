@@ -0,0 +1,42 @@
+from tests.utils.addon import load_addon_module
+
+jobs = load_addon_module("jobs")
+
+
+def _waiting():
+    """A job that only waits on work elsewhere, like a render worker pool"""
+    while True:
+        yield None
+
+
+def _frames(count):
+    for frame in range(count):
+        yield {"frame": frame}
+
+
+def test_jobs_take_turns():
+    manager = jobs.JobManager()
+
+    print("1. Submitting a waiting job, then two short jobs...")
+    pool = manager.submit("render_animation", _waiting(), total=100)
+    frame = manager.submit("render_frame", _frames(2), total=2)
+    stream = manager.submit("get_scene_info", _frames(3), total=3)
+
+    print("2. Stepping: later jobs must not wait for the first to finish...")
+    stepped = [manager.step().id for _ in range(6)]
+    assert stepped == [pool.id, frame.id, stream.id] * 2
+    for _ in range(6):
+        manager.step()
+    assert frame.state == jobs.Job.COMPLETED and frame.done == 2
+    assert stream.state == jobs.Job.COMPLETED and stream.done == 3
+    assert pool.state == jobs.Job.RUNNING
+
+    print("3. Cancelling the waiting job leaves nothing to step...")
+    manager.cancel(pool.id)
+    manager.step()
+    assert not manager.active() and manager.step() is None
+    print("✅ Job Rotation Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_jobs_take_turns()
@@ -0,0 +1,50 @@
+from tests.utils.addon import load_addon_module
+
+journal = load_addon_module("journal")
+
+
+def test_changes_since():
+    log = journal.SceneJournal()
+
+    print("1. Recording adds, edits and deletes as revisions...")
+    assert log.record(added=["Cube", "Lamp"]) == 1
+    assert log.record(modified=["Cube"]) == 2
+    assert log.record() == 2  # Nothing changed, no new revision
+    assert log.record(added=["Temp"], modified=["Lamp"]) == 3
+    assert log.record(removed=["Temp", "Cube"]) == 4
+    assert log.record(added=["Cube"]) == 5
+
+    print("2. Netting changes relative to the client's revision...")
+    assert log.changes_since(5) == {"added": [], "removed": [], "modified": []}
+    assert log.changes_since(0) == {
+        "added": ["Cube", "Lamp"],
+        "removed": [],
+        "modified": [],
+    }
+    # Temp came and went after revision 2; Cube was deleted and re-created
+    assert log.changes_since(2) == {
+        "added": [],
+        "removed": [],
+        "modified": ["Cube", "Lamp"],
+    }
+    assert log.changes_since(3)["removed"] == ["Temp"]
+    print("✅ Scene Journal Unit Test Passed!")
+
+
+def test_trimmed_history():
+    print("1. Overflowing a small journal...")
+    log = journal.SceneJournal(size=10)
+    for i in range(25):
+        log.record(modified=[f"Obj_{i}"])
+
+    print("2. Old or unknown revisions ask the client to re-fetch...")
+    assert log.changes_since(0) is None
+    assert log.changes_since(26) is None
+    assert log.stats()["retained"] <= 10
+    assert log.changes_since(20)["modified"] == [f"Obj_{i}" for i in range(20, 25)]
+    print("✅ Journal Trimming Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_changes_since()
+    test_trimmed_history()
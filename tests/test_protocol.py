@@ -0,0 +1,83 @@
+import asyncio
+import socket
+import threading
+from src.protocol import send_frame, recv_frame, write_frame, read_frame
+
+
+def test_frame_round_trip():
+    print("1. Opening a local socket pair...")
+    left, right = socket.socketpair()
+    try:
+        print("2. Sending several framed commands over one socket...")
+        for i in range(3):
+            send_frame(left, {"type": "create_cube", "params": {"i": i}})
+
+        print("3. Reading them back in order...")
+        for i in range(3):
+            message = recv_frame(right)
+            assert message["type"] == "create_cube"
+            assert message["params"]["i"] == i
+
+        print("4. Verifying clean end of stream returns None...")
+        left.close()
+        assert recv_frame(right) is None
+    finally:
+        right.close()
+    print("✅ Frame Round-trip Unit Test Passed!")
+
+
+def test_large_frame():
+    print("1. Building a multi-megabyte batch_transform payload...")
+    transforms = [
+        {"name": f"Fin_{i}", "location": [i * 0.5, 0.0, 1.0]} for i in range(100000)
+    ]
+    message = {"type": "batch_transform", "params": {"transforms": transforms}}
+
+    left, right = socket.socketpair()
+    try:
+        print("2. Streaming it through the socket from a writer thread...")
+        writer = threading.Thread(target=send_frame, args=(left, message))
+        writer.start()
+        received = recv_frame(right)
+        writer.join()
+
+        print("3. Verifying nothing was truncated...")
+        assert len(received["params"]["transforms"]) == len(transforms)
+        assert received["params"]["transforms"][-1]["name"] == "Fin_99999"
+    finally:
+        left.close()
+        right.close()
+    print("✅ Large Frame Unit Test Passed!")
+
+
+def test_async_frames():
+    async def run():
+        print("1. Starting a local asyncio echo server...")
+
+        async def echo(reader, writer):
+            while (message := await read_frame(reader)) is not None:
+                await write_frame(writer, {"status": "success", "echo": message})
+            writer.close()
+
+        server = await asyncio.start_server(echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        print("2. Exchanging frames with asyncio streams...")
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for i in range(3):
+            await write_frame(writer, {"type": "get_scene_info", "request_id": str(i)})
+            response = await read_frame(reader)
+            assert response["echo"]["request_id"] == str(i)
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+    print("✅ Async Frame Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_frame_round_trip()
+    test_large_frame()
+    test_async_frames()
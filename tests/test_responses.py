@@ -0,0 +1,31 @@
+import json
+from src.responses import compact, render
+
+
+def test_compact_mode():
+    result = {
+        "success": True,
+        "status": "success",
+        "name": "Cube",
+        "location": [0.0, 0.0, 1.0],
+        "message": "✓ [AB12CD] Object 'Cube' (cube) created successfully. Geometry verified. Proceed immediately to next modeling step.",
+    }
+
+    print("1. Dropping status flags and success prose...")
+    assert compact(result) == {"ok": True, "name": "Cube", "location": [0.0, 0.0, 1.0]}
+
+    print("2. Keeping error details, without the request id prefix...")
+    error = {"status": "error", "code": "TIMEOUT", "message": "[AB12CD] Timed out"}
+    assert compact(error) == {"ok": False, "code": "TIMEOUT", "message": "Timed out"}
+    assert compact({"success": False, "error": "No light"})["ok"] is False
+
+    print("3. Rendering minimal JSON in compact mode, indented JSON otherwise...")
+    text = render(result, "compact")
+    assert "\n" not in text and ", " not in text
+    assert json.loads(text)["name"] == "Cube"
+    assert render(result) == json.dumps(result, indent=2)
+    print("✅ Compact Response Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_compact_mode()
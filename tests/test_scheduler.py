@@ -0,0 +1,85 @@
+from collections import Counter
+from tests.utils.addon import load_addon_module
+
+scheduler = load_addon_module("scheduler")
+INTERACTIVE, NORMAL, LONG = scheduler.INTERACTIVE, scheduler.NORMAL, scheduler.LONG
+
+
+def test_weighted_lanes():
+    queue = scheduler.CommandScheduler()
+
+    print("1. Filling every lane with a backlog...")
+    for lane in (LONG, NORMAL, INTERACTIVE):
+        for i in range(50):
+            assert queue.put({"id": f"{lane}-{i}"}, lane)
+
+    print("2. Serving lanes 8:4:1 while all are busy...")
+    served = [queue.get_nowait()["lane"] for _ in range(26)]
+    assert Counter(served) == {INTERACTIVE: 16, NORMAL: 8, LONG: 2}
+    # Smooth: the long lane is not starved until the end of a round
+    assert LONG in served[:13]
+
+    print("3. Keeping FIFO order within a lane...")
+    rest = [queue.get_nowait() for _ in range(queue.depth())]
+    longs = [item["id"] for item in rest if item["lane"] == LONG]
+    assert longs == [f"{LONG}-{i}" for i in range(2, 50)]
+    assert queue.get_nowait() is None and queue.empty()
+    print("✅ Weighted Lane Unit Test Passed!")
+
+
+def test_admission_and_cancellation():
+    print("1. Rejecting commands once the queue is full...")
+    queue = scheduler.CommandScheduler(max_depth=3)
+    assert all(queue.put({"id": i}, NORMAL) for i in range(3))
+    assert not queue.put({"id": 3}, INTERACTIVE)
+    assert queue.rejected == 1 and queue.depth() == 3
+    queue.get_nowait()
+    assert queue.put({"id": 4}, "no-such-lane")  # Unknown lanes run as normal
+    assert queue.stats()[NORMAL]["depth"] == 3
+
+    print("2. Skipping a ticket cancelled before it started...")
+    ticket = scheduler.CommandTicket()
+    found = ticket.cancel("timeout")
+    assert not ticket.start()
+    assert ticket.describe_cancel(found) == {"cancelled": "before_start"}
+
+    print("3. Letting a running command finish late...")
+    ticket = scheduler.CommandTicket()
+    assert ticket.start()
+    found = ticket.cancel("client disconnected")
+    assert ticket.abandoned and ticket.state == scheduler.CommandTicket.RUNNING
+    assert ticket.describe_cancel(found)["will_finish_late"] is True
+    ticket.finish()
+    found = ticket.cancel("timeout")
+    assert ticket.describe_cancel(found) == {"cancelled": False, "finished": True}
+    print("✅ Admission and Cancellation Unit Test Passed!")
+
+
+def test_tick_stats():
+    print("1. Recording idle and busy ticks against a 20 ms budget...")
+    stats = scheduler.TickStats()
+    stats.record(0.001, 0, 0.02)
+    for ms in range(1, 21):
+        stats.record(ms / 1000.0, 2, 0.02)
+    stats.record(0.05, 1, 0.02)
+    stats.record(0.03, 0, 0.02, job_steps=1, job_seconds=0.03)
+    stats.record(0.02, 1, 0.02, job_steps=1, job_seconds=0.015)
+    for ms in (1, 2, 3, 10):
+        stats.record_wait(ms / 1000.0)
+
+    print("2. Reporting stalls, overruns and queue waits...")
+    snapshot = stats.snapshot()
+    assert snapshot["ticks"] == 24 and snapshot["busy_ticks"] == 23
+    assert snapshot["commands"] == 42 and snapshot["job_steps"] == 2
+    assert snapshot["budget_overruns"] == 2
+    assert snapshot["max_tick_ms"] == 50.0 and snapshot["p95_tick_ms"] == 30.0
+    assert snapshot["queue_wait_ms"] == {"p50": 3.0, "p95": 10.0, "max": 10.0}
+    # Time spent stepping jobs is left out of the per-command average
+    assert abs(stats.average_command_seconds() - 0.265 / 42) < 1e-9
+    print("✅ Tick Stats Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_weighted_lanes()
+    test_admission_and_cancellation()
+    test_tick_stats()
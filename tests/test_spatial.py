@@ -0,0 +1,87 @@
+import random
+from tests.utils.addon import load_addon_module
+
+spatial = load_addon_module("spatial")
+
+
+def _random_scene(count, seed=7):
+    rng = random.Random(seed)
+    boxes = {}
+    for i in range(count):
+        center = [rng.uniform(-50, 50) for _ in range(3)]
+        half = rng.uniform(0.1, 2.0)
+        boxes[f"Obj_{i}"] = ([c - half for c in center], [c + half for c in center])
+    boxes["Floor"] = ([-100.0, -100.0, -51.0], [100.0, 100.0, -50.0])
+    return boxes
+
+
+def test_grid_matches_brute_force():
+    print("1. Filling a grid, then moving and deleting some objects...")
+    boxes = _random_scene(1500)
+    grid = spatial.SpatialGrid(cell_size=2.0)
+    for name, box in boxes.items():
+        grid.insert(name, *box)
+    for i in range(0, 1500, 4):
+        del boxes[f"Obj_{i}"]
+        grid.remove(f"Obj_{i}")
+    for i in range(1, 1500, 8):
+        moved = (
+            [v + 3.0 for v in boxes[f"Obj_{i}"][0]],
+            [v + 3.0 for v in boxes[f"Obj_{i}"][1]],
+        )
+        boxes[f"Obj_{i}"] = moved
+        grid.insert(f"Obj_{i}", *moved)
+    assert "Floor" in grid._large
+
+    point = [4.0, -7.0, 2.0]
+    distances = sorted(
+        (spatial.box_distance(point, *box), name) for name, box in boxes.items()
+    )
+
+    print("2. Comparing radius, box and nearest queries with a full scan...")
+    assert {n for n, _ in grid.in_radius(point, 15.0)} == {
+        n for d, n in distances if d <= 15.0
+    }
+    low, high = [-20.0, -5.0, -60.0], [10.0, 30.0, 0.0]
+    assert set(grid.in_box(low, high)) == {
+        name
+        for name, (b_low, b_high) in boxes.items()
+        if all(b_low[i] <= high[i] and b_high[i] >= low[i] for i in range(3))
+    }
+    assert [d for _, d in grid.nearest(point, 8)] == [d for d, _ in distances[:8]]
+    far = [500.0, 500.0, 500.0]
+    assert len(grid.nearest(far, 3)) == 3
+
+    print("3. Comparing overlapping pairs with a full scan...")
+    names = sorted(boxes)
+    expected = [
+        (a, b)
+        for i, a in enumerate(names)
+        for b in names[i + 1 :]
+        if spatial.boxes_overlap(*boxes[a], *boxes[b])
+    ]
+    assert grid.overlapping_pairs() == expected
+    subset = names[:40]
+    assert grid.overlapping_pairs(subset) == [
+        (a, b) for a, b in expected if a in subset and b in subset
+    ]
+    print("✅ Spatial Grid Unit Test Passed!")
+
+
+def test_overlap_tolerance():
+    print("1. Touching boxes are not overlapping...")
+    grid = spatial.SpatialGrid(cell_size=1.0)
+    grid.insert("A", [0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+    grid.insert("B", [1.0, 0.0, 0.0], [2.0, 1.0, 1.0])
+    grid.insert("C", [1.5, 0.5, 0.5], [3.0, 1.5, 1.5])
+    assert grid.overlapping_pairs() == [("B", "C")]
+
+    print("2. Shallow contact is ignored above the tolerance...")
+    assert grid.overlapping_pairs(tolerance=0.6) == []
+    assert grid.overlapping_pairs(names=["A", "B"]) == []
+    print("✅ Overlap Tolerance Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_grid_matches_brute_force()
+    test_overlap_tolerance()
@@ -0,0 +1,67 @@
+import ast
+import glob
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _call_name(node):
+    func = node.func
+    return func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+
+
+def addon_handlers():
+    """Command names registered with @tool(...) in the addon, parsed without bpy"""
+    handlers = {}
+    pattern = os.path.join(ROOT, "blender_mcp_addon", "tools", "**", "*.py")
+    for path in glob.glob(pattern, recursive=True):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            for deco in node.decorator_list:
+                if isinstance(deco, ast.Call) and _call_name(deco) == "tool":
+                    name = deco.args[0].value if deco.args else node.name
+                    options = {
+                        k.arg: getattr(k.value, "value", None) for k in deco.keywords
+                    }
+                    assert name not in handlers, f"'{name}' registered twice"
+                    handlers[name] = options
+    return handlers
+
+
+def bridge_schemas():
+    """Tool names advertised by the bridge, parsed without the mcp package"""
+    names = []
+    pattern = os.path.join(ROOT, "src", "tools", "**", "*.py")
+    for path in glob.glob(pattern, recursive=True):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and _call_name(node) == "Tool":
+                for keyword in node.keywords:
+                    if keyword.arg == "name":
+                        names.append(keyword.value.value)
+    return names
+
+
+def test_schemas_match_handlers():
+    print("1. Collecting @tool handlers from the addon...")
+    handlers = addon_handlers()
+    assert handlers
+
+    print("2. Collecting tool schemas from the bridge...")
+    schemas = bridge_schemas()
+    assert len(schemas) == len(set(schemas)), "Duplicate tool schema names"
+
+    print("3. Verifying every advertised tool has a handler and vice versa...")
+    advertised = set(schemas)
+    handled = {name for name, opts in handlers.items() if not opts.get("internal")}
+    assert not advertised - handled, f"No handler for {sorted(advertised - handled)}"
+    assert not handled - advertised, f"No schema for {sorted(handled - advertised)}"
+    print("✅ Tool Registry Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_schemas_match_handlers()
@@ -0,0 +1,155 @@
+import ast
+import glob
+import os
+from src.validation import ArgumentValidator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CREATE_CUBE = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "location": {"type": "array", "items": {"type": "number"}},
+        "size": {"type": "number"},
+    },
+    "required": ["location"],
+}
+
+BOOLEAN = {
+    "type": "object",
+    "properties": {
+        "target_name": {"type": "string"},
+        "operation": {"type": "string", "enum": ["INTERSECT", "UNION", "DIFFERENCE"]},
+        "pattern": {
+            "anyOf": [
+                {"type": "string"},
+                {"type": "array", "items": {"type": "string"}},
+            ]
+        },
+        "transforms": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "count": {"type": "integer"},
+                },
+                "required": ["name"],
+            },
+        },
+    },
+    "required": ["target_name"],
+}
+
+
+def test_argument_errors():
+    validator = ArgumentValidator(
+        {"create_cube": CREATE_CUBE, "boolean_operation": BOOLEAN}
+    )
+
+    print("1. Accepting valid arguments (ints count as numbers, null as unset)...")
+    assert validator.validate("create_cube", {"location": [0, 1.5, 2]}) == []
+    assert (
+        validator.validate("create_cube", {"location": [0, 0, 0], "size": None}) == []
+    )
+
+    print("2. Reporting a missing required argument...")
+    assert validator.validate("create_cube", {"name": "Cube"}) == ["location: required"]
+
+    print("3. Pointing at the exact bad array element...")
+    errors = validator.validate("create_cube", {"location": [0, "1", True]})
+    assert errors == [
+        "location[1]: expected number, got string",
+        "location[2]: expected number, got boolean",
+    ]
+
+    print("4. Checking enums, anyOf and nested objects...")
+    errors = validator.validate(
+        "boolean_operation",
+        {
+            "target_name": "Wall",
+            "operation": "MERGE",
+            "pattern": 3,
+            "transforms": [{"name": "A", "count": 2.0}, {"count": 1.5}],
+        },
+    )
+    assert errors == [
+        "operation: 'MERGE' is not one of INTERSECT, UNION, DIFFERENCE",
+        "pattern: expected string or array, got integer",
+        "transforms[1].name: required",
+        "transforms[1].count: expected integer, got number",
+    ]
+
+    print("5. Rejecting unknown tools...")
+    assert validator.validate("make_coffee", {}) == ["Unknown tool 'make_coffee'"]
+    print("✅ Argument Validation Unit Test Passed!")
+
+
+def test_batch_entries():
+    batch = {
+        "type": "object",
+        "properties": {
+            "commands": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string"},
+                        "arguments": {"type": "object"},
+                    },
+                    "required": ["tool"],
+                },
+            },
+        },
+        "required": ["commands"],
+    }
+    validator = ArgumentValidator({"create_cube": CREATE_CUBE, "execute_batch": batch})
+
+    print("1. Accepting a batch of valid calls...")
+    commands = [
+        {"tool": "create_cube", "arguments": {"location": [0, 0, 0]}},
+        {"tool": "create_cube", "arguments": {"location": [2, 0, 0], "size": 1}},
+    ]
+    assert validator.validate("execute_batch", {"commands": commands}) == []
+
+    print("2. Checking each entry against its own tool's schema...")
+    commands = [
+        {"tool": "create_cube", "arguments": {"location": [0, 0, 0]}},
+        {"tool": "create_cube", "arguments": {"location": [0, "up", 0]}},
+        {"tool": "create_cube"},
+        {"tool": "make_coffee", "arguments": {}},
+    ]
+    assert validator.validate("execute_batch", {"commands": commands}) == [
+        "commands[1].arguments.location[1]: expected number, got string",
+        "commands[2].arguments.location: required",
+        "commands[3].tool: unknown tool 'make_coffee'",
+    ]
+    print("✅ Batch Entry Validation Unit Test Passed!")
+
+
+def test_tool_schemas_compile():
+    print("1. Reading every inputSchema literal from src/tools...")
+    schemas = {}
+    pattern = os.path.join(ROOT, "src", "tools", "**", "*.py")
+    for path in glob.glob(pattern, recursive=True):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and getattr(node.func, "attr", "") == "Tool":
+                fields = {k.arg: k.value for k in node.keywords}
+                name = ast.literal_eval(fields["name"])
+                schemas[name] = ast.literal_eval(fields["inputSchema"])
+    assert schemas
+
+    print(f"2. Compiling {len(schemas)} validators and checking empty calls...")
+    validator = ArgumentValidator(schemas)
+    for name, schema in schemas.items():
+        errors = validator.validate(name, {})
+        assert errors == [f"{field}: required" for field in schema.get("required", [])]
+    print("✅ Tool Schema Compilation Unit Test Passed!")
+
+
+if __name__ == "__main__":
+    test_argument_errors()
+    test_batch_entries()
+    test_tool_schemas_compile()
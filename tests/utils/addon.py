@@ -0,0 +1,21 @@
+import importlib
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "blender_mcp_addon",
+)
+# Stand-in package, so relative imports work without running the addon's
+# __init__ (which needs bpy)
+PACKAGE = "_blender_mcp_addon"
+
+
+def load_addon_module(name):
+    """Import one of the addon's pure-Python modules, e.g. 'channel'"""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")